@@ -1,108 +1,108 @@
 import os
-import json
-import time
+import logging
+import datetime as dt
+import orjson
 
 # Import configuration
 from utils.meta_config import (
     OUT_PATH,
     JOBS_LIST_URL,
     JOB_DETAILS_FILE,
+    JOBS_BY_DATE_DIR,
     MAX_PAGES,
-    HEADLESS,
     OUTPUT_DIR,
 )
 
 # Import shared helper functions from utils.meta_core
 from utils.meta_core import (
-    setup_driver,
+    setup_logging,
     scrape_details,
     load_existing_ids,
     load_existing_details,
     scrape_new_jobs_until_known_id,
-    cleanup_old_job_files
+    cleanup_old_job_files,
+    append_json_entries,
 )
+from utils.driver_pool import DriverPool
+
+log = logging.getLogger(__name__)
 
 
 def main():
-    # Load existing job IDs and details
-    existing_ids = load_existing_ids(OUT_PATH)
-    existing_details = load_existing_details(os.path.join(os.path.dirname(OUT_PATH) or ".", JOB_DETAILS_FILE))
+    # Date token for the jobs_by_date file (yesterday in UTC), computed once per run
+    yesterday_str = (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1)).strftime("%d_%B_%Y").lower()
 
-    print(f"📂 Loaded {len(existing_ids)} existing job IDs")
-    print(f"📂 Loaded {len(existing_details)} existing job details")
+    # Creates OUTPUT_DIR as well; nothing below needs to check for directories
+    os.makedirs(JOBS_BY_DATE_DIR, exist_ok=True)
 
-    # Scrape new jobs using incremental approach
-    driver = setup_driver(headless=HEADLESS)
-    try:
-        # Use incremental scraping - stops when it finds known IDs
-        new_job_ids = scrape_new_jobs_until_known_id(driver, JOBS_LIST_URL, existing_ids, max_pages=MAX_PAGES)
-    finally:
-        try:
-            driver.quit()
-        except AttributeError:
-            pass
-
-    # Update the master list of job IDs
-    all_ids = existing_ids | new_job_ids
-    ids_sorted = sorted(all_ids, key=int)
-
-    # Save updated job IDs list
-    with open(OUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(ids_sorted, f, indent=2, ensure_ascii=False)
-
-    print("\n📊 Job IDs Summary:")
-    print(f"  - Previously known: {len(existing_ids)}")
-    print(f"  - New IDs found: {len(new_job_ids)}")
-    print(f"  - Total IDs: {len(all_ids)}")
-    print(f"  - Saved to: {OUT_PATH}")
-
-    # Only scrape details for NEW job IDs if any were found
-    if new_job_ids:
-        print(f"\n🔍 Scraping details for {len(new_job_ids)} new jobs...")
-
-        # Convert set to sorted list for consistent processing
-        new_job_ids_list = sorted(new_job_ids, key=int)
-
-        # Scrape details for new jobs only
-        driver = setup_driver(headless=HEADLESS)
-        new_details = scrape_details(new_job_ids_list, driver)
-
-        # Merge new details with existing details
-        all_details = {**existing_details, **new_details}
-
-        # Save updated details
-        details_path = JOB_DETAILS_FILE
-        try:
-            os.makedirs(os.path.dirname(details_path) or ".", exist_ok=True)
-            with open(details_path, "w", encoding="utf-8") as f:
-                json.dump(all_details, f, ensure_ascii=False, indent=2)
-            # Also save yesterday's new job details to jobs_by_date folder
-            yesterday_str = (time.strftime('%d %B %Y')).lower().replace(' ', '_')
-            jobs_by_date_dir = os.path.join(os.path.dirname(OUT_PATH) or ".", "jobs_by_date")
-            yesterday_jobs_path = os.path.join(jobs_by_date_dir, f"jobs_{yesterday_str}.json")
-
-            # Create jobs_by_date directory if it doesn't exist
-            os.makedirs(jobs_by_date_dir, exist_ok=True)
-
-            # Save only today's new job details
-            with open(yesterday_jobs_path, "w", encoding="utf-8") as f:
-                json.dump(new_details, f, ensure_ascii=False, indent=2)
-
-            print("\n💾 Job Details Summary:")
-            print(f"  - Previously had details for: {len(existing_details)} jobs")
-            print(f"  - Scraped details for: {len(new_details)} new jobs")
-            print(f"  - Total details: {len(all_details)} jobs")
-            print(f"  - Saved to: {details_path}")
-            print(f"  - Yesterday's new jobs saved to: {yesterday_jobs_path}")
-
-        except (OSError, json.JSONDecodeError) as e:
-            print(f"\n❌ Error saving job details: {e}")
-    else:
-        print("\n✅ No new jobs found - details file unchanged")
-        print("All jobs on current pages are already in our database!")
+    # Load existing job IDs; details are only parsed once there is something new
+    existing_ids = load_existing_ids(OUT_PATH)
+
+    log.info(f"📂 Loaded {len(existing_ids)} existing job IDs")
+
+    # One pool of browsers serves both the listing and the details phase
+    with DriverPool() as pool:
+        # Scrape new jobs using incremental approach - stops when it finds known IDs
+        new_job_ids = scrape_new_jobs_until_known_id(None, JOBS_LIST_URL, existing_ids,
+                                                     max_pages=MAX_PAGES, pool=pool)
+
+        # Update the master list of job IDs
+        all_ids = existing_ids | new_job_ids
+
+        # Sorted string form of the new IDs, as the details stage expects them
+        new_job_ids_list = [str(x) for x in sorted(new_job_ids)]
+
+        # Rewrite the whole list so the committed file stays sorted by ID
+        with open(OUT_PATH, "wb") as f:
+            f.write(orjson.dumps([str(x) for x in sorted(all_ids)], option=orjson.OPT_INDENT_2))
+
+        log.info("\n📊 Job IDs Summary:")
+        log.info(f"  - Previously known: {len(existing_ids)}")
+        log.info(f"  - New IDs found: {len(new_job_ids)}")
+        log.info(f"  - Total IDs: {len(all_ids)}")
+        log.info(f"  - Saved to: {OUT_PATH}")
+
+        # Only scrape details for NEW job IDs if any were found
+        if new_job_ids:
+            log.info(f"\n🔍 Scraping details for {len(new_job_ids)} new jobs...")
+
+            # Scrape details for new jobs only, reusing the pool's browsers
+            new_details = scrape_details(new_job_ids_list, None, pool=pool)
+
+            # Save updated details
+            details_path = JOB_DETAILS_FILE
+            try:
+                # Append only the new records to the details file; the existing
+                # corpus is only loaded when the file has to be rewritten
+                if not append_json_entries(details_path, new_details):
+                    all_details = load_existing_details(details_path)
+                    all_details.update(new_details)
+                    with open(details_path, "wb") as f:
+                        f.write(orjson.dumps(all_details, option=orjson.OPT_INDENT_2))
+                # Also save yesterday's new job details to jobs_by_date folder
+                yesterday_jobs_path = os.path.join(JOBS_BY_DATE_DIR, f"jobs_{yesterday_str}.json")
+
+                # Save only today's new job details
+                with open(yesterday_jobs_path, "wb") as f:
+                    f.write(orjson.dumps(new_details, option=orjson.OPT_INDENT_2))
+
+                log.info("\n💾 Job Details Summary:")
+                log.info(f"  - Scraped details for: {len(new_details)} new jobs")
+                log.info(f"  - Saved to: {details_path}")
+                log.info(f"  - Yesterday's new jobs saved to: {yesterday_jobs_path}")
+
+            except (OSError, orjson.JSONEncodeError) as e:
+                log.warning(f"\n❌ Error saving job details: {e}")
+        else:
+            log.info("\n✅ No new jobs found - details file unchanged")
+            log.info("All jobs on current pages are already in our database!")
 
     files_removed = cleanup_old_job_files(OUTPUT_DIR)
-    print(f"Total files removed in jobs by date: {files_removed}")
+    log.info(f"Total files removed in jobs by date: {files_removed}")
 
 if __name__ == "__main__":
-    main()
+    listener = setup_logging()
+    try:
+        main()
+    finally:
+        listener.stop()
@@ -1,7 +1,7 @@
 """Scrapes job IDs and details from Meta jobs and saves them to JSON files."""
 
-import os
-import json
+import logging
+import orjson
 
 # Import configuration
 from utils.meta_config import (
@@ -9,65 +9,54 @@ from utils.meta_config import (
     JOBS_LIST_URL,
     JOB_DETAILS_FILE,
     MAX_PAGES,
-    HEADLESS,
 )
 
 # Import shared helper functions from utils.meta_core
 from utils.meta_core import (
-    setup_driver,
+    setup_logging,
     scrape_multiple_pages,
     scrape_details,
     load_existing_ids,
+    JsonObjectWriter,
 )
+from utils.driver_pool import DriverPool
 
-def main():
-    driver = setup_driver(headless=HEADLESS)
-    try:
-        # Use the new pagination function to scrape multiple pages
-        found_ids = scrape_multiple_pages(driver, JOBS_LIST_URL, max_pages=MAX_PAGES)
-    finally:
-        try:
-            driver.quit()
-        except AttributeError:
-            pass
-
-    # Merge con JSON existente y guardar
-    existing_ids = load_existing_ids(OUT_PATH)
-    merged = existing_ids | found_ids
-    new_count = len(merged) - len(existing_ids)
-
-    ids_sorted = sorted(merged, key=int)
-    with open(OUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(ids_sorted, f, indent=2, ensure_ascii=False)
-
-    print(f"Found {len(found_ids)} IDs this run.")
-    print(f"Existing file had {len(existing_ids)} IDs.")
-    print(f"Added {new_count} new IDs. Saved {len(ids_sorted)} total to {OUT_PATH}.")
+log = logging.getLogger(__name__)
 
-    # ---- Load job IDs correctly (don’t overwrite) ----
-    with open(OUT_PATH, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    if isinstance(raw, dict):
-        job_ids = [str(k) for k in raw.keys()]
-    elif isinstance(raw, list):
-        job_ids = [str(x) for x in raw]
-    else:
-        raise ValueError("OUT_PATH must contain a list of IDs or a dict keyed by IDs.")
 
-    driver = setup_driver(headless=HEADLESS)
-
-    results = scrape_details(job_ids, driver)
-
-    # Optional: write results next to your OUT_PATH
-    out_dir = os.path.dirname(OUT_PATH) or "."
-    details_path = JOB_DETAILS_FILE
-    try:
-        os.makedirs(out_dir, exist_ok=True)
-        with open(details_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
-        print(f"\nSaved {len(results)} jobs to {details_path}")
-    except (OSError, IOError) as e:
-        print(f"\n[Warn] Could not save results: {e}")
+def main():
+    # One pool of browsers serves both the listing and the details phase
+    with DriverPool() as pool:
+        # Use the new pagination function to scrape multiple pages, several at a time
+        found_ids = scrape_multiple_pages(None, JOBS_LIST_URL, max_pages=MAX_PAGES, pool=pool)
+
+        # Merge con JSON existente y guardar
+        existing_ids = load_existing_ids(OUT_PATH)
+        merged = existing_ids | found_ids
+        new_count = len(merged) - len(existing_ids)
+
+        ids_sorted = sorted(merged)
+        # Kept for the details stage instead of reading OUT_PATH back
+        job_ids = [str(x) for x in ids_sorted]
+        with open(OUT_PATH, "wb") as f:
+            f.write(orjson.dumps(job_ids, option=orjson.OPT_INDENT_2))
+
+        log.info(f"Found {len(found_ids)} IDs this run.")
+        log.info(f"Existing file had {len(existing_ids)} IDs.")
+        log.info(f"Added {new_count} new IDs. Saved {len(ids_sorted)} total to {OUT_PATH}.")
+
+        # Stream each job's details to disk as soon as it is scraped
+        details_path = JOB_DETAILS_FILE
+        try:
+            with JsonObjectWriter(details_path) as writer:
+                scrape_details(job_ids, None, writer=writer, pool=pool)
+            log.info(f"\nSaved {writer.count} jobs to {details_path}")
+        except (OSError, IOError) as e:
+            log.warning(f"\n[Warn] Could not save results: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    listener = setup_logging()
+    try:
+        main()
+    finally:
+        listener.stop()
@@ -0,0 +1,87 @@
+"""
+driver_pool.py
+
+A small pool of Selenium Chrome drivers shared by the Meta scraper phases.
+
+Launching Chrome takes seconds, so the listing and details phases borrow
+drivers from one pool instead of each starting (and quitting) their own.
+"""
+
+import queue
+import threading
+import contextlib
+from typing import Callable, Iterable, List
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.meta_config import DETAIL_WORKERS, HEADLESS
+from utils.meta_core import setup_driver
+
+
+class DriverPool:
+    """Lend up to `size` WebDrivers, creating them lazily on first use.
+
+    Drivers passed in `seed` are lent out like the others but belong to the
+    caller, so `close()` leaves them running; drivers the pool created are
+    quit on close.
+
+    Args:
+        size: Maximum number of drivers the pool hands out at once.
+        factory: Callable returning a new driver; defaults to `setup_driver`.
+        seed: Existing drivers to lend before creating new ones.
+    """
+
+    def __init__(self, size: int = DETAIL_WORKERS, factory: Callable = None, seed: Iterable = ()):
+        self._factory = factory or (lambda: setup_driver(headless=HEADLESS))
+        self._idle: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._seeded: List = list(seed)
+        self._created: List = []
+        self.size = max(size, len(self._seeded), 1)
+        for d in self._seeded:
+            self._idle.put(d)
+
+    def get_driver(self):
+        """Return an idle driver, creating one if the pool isn't full yet."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._seeded) + len(self._created) < self.size:
+                d = self._factory()
+                self._created.append(d)
+                return d
+        return self._idle.get()
+
+    def release_driver(self, driver) -> None:
+        """Stop any loading on `driver` and make it available again."""
+        try:
+            driver.execute_script("window.stop();")
+        except WebDriverException:
+            pass
+        self._idle.put(driver)
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """Borrow a driver for the duration of a `with` block."""
+        d = self.get_driver()
+        try:
+            yield d
+        finally:
+            self.release_driver(d)
+
+    def close(self) -> None:
+        """Quit every driver the pool created."""
+        for d in self._created:
+            try:
+                d.quit()
+            except (WebDriverException, AttributeError):
+                pass
+        self._created.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -23,6 +23,7 @@ JOBS_LIST_URL = config["companies"][1]["searchSettings"]["searchURL"]
 OUTPUT_DIR = f"{config['companies'][1]['companyName']}-jobs"
 OUT_PATH = os.path.join(OUTPUT_DIR, "meta_job_ids.json")
 JOB_DETAILS_FILE = os.path.join(OUTPUT_DIR, "meta_job_details.json")
+JOBS_BY_DATE_DIR = os.path.join(OUTPUT_DIR, "jobs_by_date")
 MAX_PAGES = config["companies"][1]["searchSettings"].get("numberOfPages", 10)  # Maximum pages to scrape (999 = all pages)
 
 # ==================== SCRAPING SETTINGS ====================
@@ -40,15 +41,22 @@ WINDOW_HEIGHT = 900
 PAGE_LOAD_TIMEOUT = 60  # seconds
 ELEMENT_WAIT_TIMEOUT = 20  # seconds for job links to appear
 COOKIE_WAIT_TIMEOUT = 3  # seconds to wait for cookie buttons
+WAIT_POLL_FREQUENCY = 0.1  # seconds between WebDriverWait checks (Selenium default is 0.5)
 
 # Scrolling settings
 SCROLL_ROUNDS = int(os.getenv("SCROLL_ROUNDS", "6"))  # Number of scroll rounds per page
 SCROLL_PAUSE = 1.0  # Seconds to pause between scrolls
+SCROLL_NETWORK_IDLE = 0.5  # Seconds without network activity after a scroll that end scrolling early
 
 # Delays and rate limiting
 DELAY_BETWEEN_PAGES = 7  # Seconds to wait between pages
 DELAY_BETWEEN_JOBS = 2  # Seconds to wait between job detail requests
-REACT_RENDER_DELAY = 5  # Seconds to wait for React to render job details
+REACT_RENDER_TIMEOUT = 5  # Max seconds to wait for React to render job details
+
+# Parallelism
+DETAIL_WORKERS = int(os.getenv("DETAIL_WORKERS", "4"))  # Browsers loading job details concurrently
+HTTP_CONCURRENCY = int(os.getenv("HTTP_CONCURRENCY", "20"))  # Job pages fetched over plain HTTP at once
+HTTP_TIMEOUT = 25  # seconds per plain HTTP request
 
 # ==================== CSS SELECTORS AND XPATHS ====================
 
@@ -60,8 +68,8 @@ COOKIE_XPATHS: List[str] = [
     "//*[@aria-label[contains(.,'Accept')]]"
 ]
 
-# XPath for job links
-JOB_LINKS_XPATH = "//a[contains(@href,'/jobs')]"
+# CSS selector for job links (matched natively, faster than XPath)
+JOB_LINKS_CSS = 'a[href*="/jobs"]'
 
 # CSS class names for job detail extraction
 JOB_DETAIL_CLASSES = {
@@ -87,6 +95,24 @@ HEADLESS_OPTIONS: List[str] = [
     "--headless=new"
 ]
 
+# Content Chrome should not download; the scraper only reads rendered text
+# (2 = block). Stylesheets stay enabled because infinite scroll needs layout.
+CHROME_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+}
+
+# URL patterns dropped via the DevTools protocol: fonts, media and trackers
+BLOCKED_URL_PATTERNS: List[str] = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.mp4",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*connect.facebook.net*", "*facebook.com/tr*", "*/analytics*", "*/pixel*",
+]
+
+# Attach to an already running Chrome (started with --remote-debugging-port)
+# instead of launching one, e.g. "127.0.0.1:9222". Use with DETAIL_WORKERS=1.
+CHROME_DEBUGGER_ADDRESS = os.getenv("CHROME_DEBUGGER_ADDRESS", "")
+
 # ==================== DATA EXTRACTION SETTINGS ====================
 
 # Maximum length for preview text in debug output
@@ -4,13 +4,20 @@ meta_core.py
 Utility functions for scraping job listings and details from Meta Careers.
 """
 
+import asyncio
 import datetime as dt
 import glob
 import re
-import json
 import time
+import sys
+import queue
+import logging
+import logging.handlers
+import itertools
+import weakref
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urljoin
 from typing import Dict, List, Any
 
 from selenium import webdriver
@@ -22,8 +29,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
+from lxml import etree, html as lxml_html
+import httpx
 
 # Import only required configuration from utils.meta_config
 from utils.meta_config import (
@@ -35,21 +43,143 @@ from utils.meta_config import (
     PAGE_LOAD_TIMEOUT,
     COOKIE_XPATHS,
     COOKIE_WAIT_TIMEOUT,
+    WAIT_POLL_FREQUENCY,
     SCROLL_PAUSE,
+    SCROLL_NETWORK_IDLE,
     SCROLL_ROUNDS,
     WHITESPACE_PATTERN,
-    MAX_PREVIEW_ITEMS,
-    MAX_PREVIEW_CHARS,
-    JOB_LINKS_XPATH,
+    JOB_LINKS_CSS,
     JOB_ID_PATTERN,
     ELEMENT_WAIT_TIMEOUT,
     DELAY_BETWEEN_PAGES,
     DELAY_BETWEEN_JOBS,
     BASE_URL,
-    REACT_RENDER_DELAY,
+    REACT_RENDER_TIMEOUT,
     JOB_DETAIL_CLASSES,
+    JOB_FIELDS,
+    DETAIL_WORKERS,
+    CHROME_DEBUGGER_ADDRESS,
+    CHROME_CONTENT_PREFS,
+    BLOCKED_URL_PATTERNS,
+    HTTP_CONCURRENCY,
+    HTTP_TIMEOUT,
 )
 
+log = logging.getLogger(__name__)
+
+# Compiled once at import; these run per tag / per anchor in the hot loops
+_WS_RE = re.compile(WHITESPACE_PATTERN)
+_JOBID_RE = re.compile(JOB_ID_PATTERN)
+
+# Record fields whose values repeat across many jobs
+_INTERNED_FIELDS = ("title", "location", "compensation")
+
+# time.monotonic() of each driver's last job detail load; weakly keyed so an
+# entry goes away with its driver instead of being inherited through a reused id()
+_LAST_DETAIL_LOAD: "weakref.WeakKeyDictionary[Any, float]" = weakref.WeakKeyDictionary()
+
+# First <div> containing a class, and descendants whose whole class string
+# equals $c; compiled once and reused for every job page
+_CONTAINER_XP = etree.XPath(
+    "(descendant-or-self::div[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $c, ' '))])[1]"
+)
+_CLASS_XP = etree.XPath(".//*[normalize-space(@class) = $c]")
+
+# CSS selector for the job title; its presence means React has rendered the details
+TITLE_SELECTOR = "." + ".".join(JOB_DETAIL_CLASSES["title_class"].split())
+
+# Collects every job link href in a single WebDriver call instead of one
+# get_attribute round-trip per anchor. document.links is the browser's own
+# link list and .href is already resolved to an absolute URL.
+_JOB_HREFS_JS = (
+    "return Array.from(document.links, a => a.href)"
+    ".filter(h => h.indexOf('/jobs/') !== -1 && h.indexOf('?page=') === -1);"
+)
+
+# Scrolls to the bottom up to `rounds` times, continuing as soon as the page
+# grows and finishing once a scroll brings no new content within `pauseMs`
+# Promise-returning scroll loop, called with (pauseMs, rounds, idleMs). A round
+# ends when the document grows, when no resource has loaded for idleMs after
+# the scroll, or after pauseMs; the loop stops on the first round without growth
+_SCROLL_JS = """(function (pauseMs, rounds, idleMs) { return new Promise(function (resolve) {
+    var last = document.body.scrollHeight, i = 0, lastNet = performance.now(), net = null;
+    if (window.PerformanceObserver) {
+        net = new PerformanceObserver(function () { lastNet = performance.now(); });
+        try { net.observe({type: 'resource'}); } catch (e) { net = null; }
+    }
+    function finish(h) { if (net) { net.disconnect(); } resolve(h); }
+    function round() {
+        if (i++ >= rounds) { return finish(last); }
+        var settled = false, started, timer, poll, obs;
+        function next() {
+            if (settled) { return; }
+            settled = true;
+            obs.disconnect();
+            clearTimeout(timer);
+            clearInterval(poll);
+            var h = document.body.scrollHeight;
+            if (h === last) { return finish(h); }
+            last = h;
+            setTimeout(round, 0);
+        }
+        obs = new MutationObserver(function () {
+            if (document.body.scrollHeight !== last) { next(); }
+        });
+        obs.observe(document.body, {childList: true, subtree: true});
+        timer = setTimeout(next, pauseMs);
+        if (net) {
+            poll = setInterval(function () {
+                var now = performance.now();
+                if (now - started >= idleMs && now - lastNet >= idleMs) { next(); }
+            }, 50);
+        }
+        started = performance.now();
+        window.scrollTo(0, document.body.scrollHeight);
+    }
+    round();
+}); })"""
+
+# Returns the outerHTML of the first <div> carrying each given class string, so
+# only the job containers are parsed instead of the whole rendered page
+_CONTAINERS_HTML_JS = (
+    "return Array.from(arguments).map(function (c) {"
+    " var e = document.querySelector('div.' + c.trim().split(/\\s+/).join('.'));"
+    " return e ? e.outerHTML : ''; });"
+)
+
+def block_heavy_requests(driver) -> None:
+    """Drop font, media and tracker requests in `driver` via the DevTools protocol.
+
+    Failures are ignored so drivers without CDP support still work, just
+    without the bandwidth savings.
+    """
+    if not BLOCKED_URL_PATTERNS:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except (WebDriverException, AttributeError):
+        pass
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Send all log records through a queue drained by a background thread.
+
+    Scraping threads only enqueue records; a QueueListener formats and
+    writes them to stdout. Call `.stop()` on the returned listener before
+    exiting so queued records are flushed.
+    """
+    q: queue.Queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    listener = logging.handlers.QueueListener(q, handler)
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(q)]
+    root.setLevel(level)
+    listener.start()
+    return listener
+
+
 def setup_driver(headless: bool = True):
     """Create and return a configured Selenium Chrome WebDriver.
 
@@ -59,10 +189,21 @@ def setup_driver(headless: bool = True):
     Args:
         headless: If True, enable headless/browserless options from config.
 
+    Attaches to a running Chrome instead when ``CHROME_DEBUGGER_ADDRESS`` is
+    set.
+
     Returns:
         A configured instance of selenium.webdriver.Chrome.
     """
     opts = ChromeOptions()
+    if CHROME_DEBUGGER_ADDRESS:
+        # Launch flags don't apply to a browser that is already running
+        opts.add_experimental_option("debuggerAddress", CHROME_DEBUGGER_ADDRESS)
+        d = webdriver.Chrome(options=opts)
+        d.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        block_heavy_requests(d)
+        return d
+
     if headless:
         for option in HEADLESS_OPTIONS:
             opts.add_argument(option)
@@ -78,6 +219,8 @@ def setup_driver(headless: bool = True):
     opts.add_argument("--log-level=3")
     opts.add_argument("--no-first-run")
     opts.add_argument("--no-default-browser-check")
+    if CHROME_CONTENT_PREFS:
+        opts.add_experimental_option("prefs", CHROME_CONTENT_PREFS)
     # Configure Service to send logs to the null device and avoid creating a
     # visible child console on Windows.
     service_kwargs = {'log_path': os.devnull}
@@ -90,9 +233,29 @@ def setup_driver(headless: bool = True):
         with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
             d = webdriver.Chrome(options=opts, service=Service(**service_kwargs))
     d.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    block_heavy_requests(d)
     return d
 
 
+def driver_wait(driver, timeout: float) -> WebDriverWait:
+    """Return the driver's reusable WebDriverWait for `timeout` seconds.
+
+    Waits poll every `WAIT_POLL_FREQUENCY` seconds and retry through stale
+    elements, so a React re-render during the wait doesn't abort it. One
+    wait per timeout is built on first use and kept on the driver.
+    """
+    waits = getattr(driver, "_waits", None)
+    if waits is None:
+        waits = driver._waits = {}
+    w = waits.get(timeout)
+    if w is None:
+        w = waits[timeout] = WebDriverWait(
+            driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY,
+            ignored_exceptions=(StaleElementReferenceException,),
+        )
+    return w
+
+
 def accept_cookies_if_present(driver):
     """Attempt to accept cookie dialogs using configured XPATHs.
 
@@ -105,7 +268,7 @@ def accept_cookies_if_present(driver):
     """
     for xp in COOKIE_XPATHS:
         try:
-            btn = WebDriverWait(driver, COOKIE_WAIT_TIMEOUT).until(EC.element_to_be_clickable((By.XPATH, xp)))
+            btn = driver_wait(driver, COOKIE_WAIT_TIMEOUT).until(EC.element_to_be_clickable((By.XPATH, xp)))
             btn.click()
             time.sleep(0.5)
             break
@@ -113,30 +276,44 @@ def accept_cookies_if_present(driver):
             pass
 
 
-def scroll_infinite(driver, pause_s: float = SCROLL_PAUSE, rounds: int = SCROLL_ROUNDS):
+def scroll_infinite(driver, pause_s: float = SCROLL_PAUSE, rounds: int = SCROLL_ROUNDS,
+                    idle_s: float = SCROLL_NETWORK_IDLE):
     """Scroll the page to the bottom multiple times to trigger lazy loading.
 
-    Performs `rounds` iterations of scrolling to the document bottom and
-    waits `pause_s` seconds between iterations. Stops early if the
-    document height does not change between rounds.
+    The whole loop runs inside the browser as one promise awaited through
+    the DevTools `Runtime.evaluate` command: each round scrolls to the
+    bottom and moves on as soon as the document grows, or stops once
+    `pause_s` passes without new content, or earlier once no resource has
+    loaded for `idle_s`. At most `rounds` rounds are attempted. Drivers
+    without CDP run the same loop through `execute_async_script`.
 
     Args:
         driver: Selenium WebDriver instance.
-        pause_s: Seconds to wait between scroll rounds.
+        pause_s: Max seconds to wait for new content after each scroll.
         rounds: Maximum number of scroll rounds to attempt.
+        idle_s: Seconds of network quiet after a scroll that end the loop.
     """
-    last_h = driver.execute_script("return document.body.scrollHeight")
-    for _ in range(rounds):
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(pause_s)
-        h = driver.execute_script("return document.body.scrollHeight")
-        if h == last_h:
-            break
-        last_h = h
+    args = (int(pause_s * 1000), rounds, int(idle_s * 1000))
+    try:
+        driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": f"{_SCROLL_JS}{args}",
+            "awaitPromise": True,
+            "returnByValue": True,
+        })
+        return
+    except (WebDriverException, AttributeError):
+        pass
+    driver.set_script_timeout(pause_s * rounds + 5)
+    try:
+        driver.execute_async_script(
+            f"{_SCROLL_JS}.apply(null, arguments).then(arguments[arguments.length - 1]);", *args
+        )
+    except TimeoutException:
+        pass
 
 
-def load_existing_ids(path: str) -> set:
-    """Load existing job IDs from a JSON file and return as a set of strings.
+def load_existing_ids(path: str) -> frozenset:
+    """Load existing job IDs from a JSON file and return as a frozenset of ints.
 
     The function tolerates missing files and malformed JSON and only returns
     numeric-like IDs (strings made of digits). This is used to compare
@@ -146,19 +323,18 @@ def load_existing_ids(path: str) -> set:
         path: Path to a JSON file containing a list or iterable of IDs.
 
     Returns:
-        A set of numeric string IDs found in the file, or an empty set.
+        A frozenset of integer IDs found in the file, or an empty frozenset.
     """
     p = Path(path)
     if not p.exists():
         os.makedirs(p.parent, exist_ok=True)
-        return set()
+        return frozenset()
     try:
-        with open(p, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Ensure they're numeric strings
-        return {str(x) for x in data if isinstance(x, (str, int)) and str(x).isdigit()}
-    except (OSError, json.JSONDecodeError):
-        return set()
+        data = orjson.loads(p.read_bytes())
+        # Keep only numeric IDs, as ints: cheap to hash, intersect and sort
+        return frozenset(int(s) for s in (str(x) for x in data if isinstance(x, (str, int))) if s.isdigit())
+    except (OSError, orjson.JSONDecodeError):
+        return frozenset()
 
 
 def load_existing_details(path: str) -> Dict[str, Any]:
@@ -176,9 +352,8 @@ def load_existing_details(path: str) -> Dict[str, Any]:
     if not p.exists():
         return {}
     try:
-        with open(p, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
+        return orjson.loads(p.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
         return {}
 
 
@@ -195,125 +370,93 @@ def clean(s: str) -> str:
     Returns:
         A cleaned string with normalized internal whitespace.
     """
-    return re.sub(WHITESPACE_PATTERN, " ", s or "").strip()
+    return _WS_RE.sub(" ", s or "").strip()
 
 
-def extract_from_div(soup: BeautifulSoup, class_name: str) -> Dict[str, List[str]]:
-    """Extract text grouped by element classes from a DIV with `class_name`.
+def find_container(root, class_name: str):
+    """Return the first <div> in `root` carrying `class_name`, or None."""
+    if root is None:
+        return None
+    found = _CONTAINER_XP(root, c=class_name)
+    return found[0] if found else None
 
-    Finds the first <div> with the provided class name and iterates its child
-    tags collecting cleaned text grouped by the tag's class attribute. Useful
-    for exploring the structure of job detail pages where sections share a
-    container class.
 
-    Args:
-        soup: BeautifulSoup-parsed document.
-        class_name: Class name of the container div to search for.
+def class_texts(container, class_name: str) -> List[str]:
+    """Cleaned, non-empty texts of the elements whose class string is `class_name`.
 
-    Returns:
-        A mapping of class-string -> list of texts extracted from elements.
+    Only elements matching the compiled class XPath are visited, so text is
+    never gathered for the rest of the container.
     """
-    container = soup.find("div", class_=class_name)
-    if not container:
-        return {}
-    class_groups: Dict[str, List[str]] = {}
-    for tag in container.find_all(True):
-        txt = clean(tag.get_text(" "))
-        if not txt:
-            continue
-        tag_class = tag.get("class", [])
-        class_str = " ".join(tag_class) if tag_class else "no-class"
-        class_groups.setdefault(class_str, []).append(txt)
-    return class_groups
-
-
-def preview_items(items: Dict[str, List[str]], label: str, max_items: int = MAX_PREVIEW_ITEMS, max_chars: int = MAX_PREVIEW_CHARS):
-    """Pretty-print a compact preview of extracted class groups and texts.
+    if container is None:
+        return []
+    texts = (clean(" ".join(el.itertext())) for el in _CLASS_XP(container, c=" ".join(class_name.split())))
+    return [t for t in texts if t]
 
-    This helper prints up to `max_items` of the keys in `items` and a short
-    preview of the text found for each key (truncated to `max_chars`). It is
-    primarily used for debugging and understanding HTML structure during
-    scraping.
-
-    Args:
-        items: Mapping of class-name -> list of extracted texts.
-        label: Label used in the printed header.
-        max_items: Maximum number of groups to show.
-        max_chars: Maximum characters to display per group preview.
-    """
-    print(f"\n[Preview] {label}: found {len(items)} class groups")
-    for i, (cls, texts) in enumerate(items.items()):
-        if i >= max_items:
-            print("... (more omitted)")
-            break
-        joined = " | ".join(texts[:3])
-        if len(joined) > max_chars:
-            joined = joined[:max_chars].rstrip() + "..."
-        print(f"  [{i}] <{cls}> → {joined}")
 
+def pace(started: float, interval: float) -> None:
+    """Sleep only for what is left of `interval` since `started`.
 
-def safe_pick(items: Dict[str, List[str]], key: str, idx: int = 0, label: str = "") -> str:
+    `started` is a time.monotonic() value taken when the previous request
+    began, so time spent loading and parsing counts toward the delay.
     """
-    Try to pick items[key][idx]; if missing, preview available keys and return "".
-    """
-    try:
-        return items[key][idx]
-    except (KeyError, IndexError, TypeError):
-        print(f"\n[Warn] Could not find key='{key}' idx={idx} in {label}.")
-        preview_items(items, label=label)
-        return ""
+    remaining = interval - (time.monotonic() - started)
+    if remaining > 0:
+        time.sleep(remaining)
 
 
 def scrape_jobs_from_page(driver, page_url: str) -> set:
     """
     Scrape job IDs from a single page.
-    Returns a set of job ID strings.
+    Returns a set of integer job IDs.
     """
     found_ids = set()
     try:
-        print(f"Scraping page: {page_url}")
+        log.info("Scraping page: %s", page_url)
         driver.get(page_url)
         accept_cookies_if_present(driver)
 
         # Wait for job links to appear
         try:
-            WebDriverWait(driver, ELEMENT_WAIT_TIMEOUT).until(
-                EC.presence_of_element_located((By.XPATH, JOB_LINKS_XPATH))
+            driver_wait(driver, ELEMENT_WAIT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_LINKS_CSS))
             )
         except TimeoutException:
-            print("No job links found on this page")
+            log.info("No job links found on this page")
             return found_ids
 
         # Load content with scrolling
         scroll_infinite(driver)
 
-        # Take all <a> with '/jobs' and extract numeric IDs
-        anchors = driver.find_elements(By.XPATH, JOB_LINKS_XPATH)
-        for a in anchors:
-            try:
-                href = a.get_attribute("href") or ""
-                if not href or "?page=" in href:
-                    continue
-                href = href if href.startswith("http") else urljoin("https://www.metacareers.com", href)
-                m = re.search(JOB_ID_PATTERN, href)
-                if m:
-                    found_ids.add(m.group(1))
-            except StaleElementReferenceException:
+        # Take all <a> with '/jobs' in one round-trip and extract numeric IDs
+        hrefs = driver.execute_script(_JOB_HREFS_JS) or []
+        for href in hrefs:
+            # Plain string check for the usual .../jobs/<digits> shape; the
+            # configured regex only runs for anything else
+            tail = href.rpartition("/jobs/")[2]
+            if tail.isascii() and tail.isdigit():
+                found_ids.add(int(tail))
                 continue
+            m = _JOBID_RE.search(href)
+            if m:
+                found_ids.add(int(m.group(1)))
         
-        print(f"Found {len(found_ids)} job IDs on this page")
+        log.info("Found %d job IDs on this page", len(found_ids))
         return found_ids
     
     except (TimeoutException, StaleElementReferenceException) as e:
-        print(f"Error scraping page {page_url}: {e}")
+        log.warning("Error scraping page %s: %s", page_url, e)
         return found_ids
 
-def scrape_multiple_pages(driver, base_url: str, max_pages: int = 999) -> set:
+def scrape_multiple_pages(driver, base_url: str, max_pages: int = 999, pool=None) -> set:
     """
     Scrape job IDs from ALL available pages.
     Automatically stops when no more jobs are found.
-    Returns a set of all unique job ID strings found.
+    With a DriverPool, pages are loaded `pool.size` at a time in parallel.
+    Returns a set of all unique integer job IDs found.
     """
+    if pool is not None:
+        return _scrape_pages_parallel(pool, base_url, max_pages)
+
     all_found_ids = set()
     page_num = 1
     
@@ -326,131 +469,428 @@ def scrape_multiple_pages(driver, base_url: str, max_pages: int = 999) -> set:
             # Pages 2+ use &page=2, &page=3, etc.
             page_url = f"{base_url}&page={page_num}"
         
+        started = time.monotonic()
         page_ids = scrape_jobs_from_page(driver, page_url)
         
         # If no IDs found on this page, we've reached the end
         if not page_ids:
-            print(f"No job IDs found on page {page_num}. Reached end of available pages.")
+            log.info(f"No job IDs found on page {page_num}. Reached end of available pages.")
             break
             
         all_found_ids.update(page_ids)
-        print(f"Page {page_num}: Found {len(page_ids)} jobs (Total so far: {len(all_found_ids)})")
+        log.info(f"Page {page_num}: Found {len(page_ids)} jobs (Total so far: {len(all_found_ids)})")
         
-        # Add delay between pages to be respectful
-        time.sleep(DELAY_BETWEEN_PAGES)
+        # Keep pages at least DELAY_BETWEEN_PAGES apart to be respectful
+        pace(started, DELAY_BETWEEN_PAGES)
         page_num += 1
     
-    print(f"Finished scraping. Total unique job IDs found across {page_num - 1} pages: {len(all_found_ids)}")
+    log.info(f"Finished scraping. Total unique job IDs found across {page_num - 1} pages: {len(all_found_ids)}")
     return all_found_ids
 
 
-def scrape_new_jobs_until_known_id(driver, base_url: str, existing_ids: set, max_pages: int = 999) -> set:
+def _scrape_pages_parallel(pool, base_url: str, max_pages: int) -> set:
+    """Scrape listing pages in batches of `pool.size`, stopping at the first empty page."""
+    def load(page_num: int) -> set:
+        page_url = base_url if page_num == 1 else f"{base_url}&page={page_num}"
+        with pool.acquire() as d:
+            return scrape_jobs_from_page(d, page_url)
+
+    all_found_ids = set()
+    last_page = 0
+    with ThreadPoolExecutor(max_workers=pool.size) as ex:
+        for start in range(1, max_pages + 1, pool.size):
+            pages = list(range(start, min(start + pool.size, max_pages + 1)))
+            started = time.monotonic()
+            for page_num, page_ids in zip(pages, ex.map(load, pages)):
+                if not page_ids:
+                    log.info(f"No job IDs found on page {page_num}. Reached end of available pages.")
+                    break
+                all_found_ids.update(page_ids)
+                last_page = page_num
+                log.info(f"Page {page_num}: Found {len(page_ids)} jobs (Total so far: {len(all_found_ids)})")
+            else:
+                # Keep batches at least DELAY_BETWEEN_PAGES apart to be respectful
+                pace(started, DELAY_BETWEEN_PAGES)
+                continue
+            break
+
+    log.info(f"Finished scraping. Total unique job IDs found across {last_page} pages: {len(all_found_ids)}")
+    return all_found_ids
+
+
+def _listing_pages(driver, pool, base_url: str, max_pages: int):
+    """Yield `(page_num, page_ids)` in page order.
+
+    Without a pool pages are loaded one at a time on `driver`. With a pool,
+    up to `pool.size` pages are loaded ahead on the pool's drivers while
+    earlier ones are inspected; closing the generator cancels whatever
+    hasn't started yet.
+    """
+    def load(page_num: int, d=None):
+        page_url = base_url if page_num == 1 else f"{base_url}&page={page_num}"
+        started = time.monotonic()
+        if d is not None:
+            page_ids = scrape_jobs_from_page(d, page_url)
+        else:
+            with pool.acquire() as d:
+                page_ids = scrape_jobs_from_page(d, page_url)
+                # Keep each browser's pages at least DELAY_BETWEEN_PAGES apart
+                pace(started, DELAY_BETWEEN_PAGES)
+        return page_ids
+
+    if pool is None:
+        for page_num in range(1, max_pages + 1):
+            started = time.monotonic()
+            yield page_num, load(page_num, driver)
+            # Keep pages at least DELAY_BETWEEN_PAGES apart to be respectful
+            pace(started, DELAY_BETWEEN_PAGES)
+        return
+
+    pages = iter(range(1, max_pages + 1))
+    with ThreadPoolExecutor(max_workers=pool.size) as ex:
+        ahead = [(n, ex.submit(load, n)) for n in itertools.islice(pages, pool.size)]
+        try:
+            while ahead:
+                page_num, fut = ahead.pop(0)
+                for n in itertools.islice(pages, 1):
+                    ahead.append((n, ex.submit(load, n)))
+                yield page_num, fut.result()
+        finally:
+            for _, fut in ahead:
+                fut.cancel()
+
+
+def scrape_new_jobs_until_known_id(driver, base_url: str, existing_ids: set, max_pages: int = 999,
+                                   pool=None) -> set:
     """
     Scrape job IDs from pages until we find a previously known ID.
     This implements incremental scraping - only get new jobs since last run.
-    Returns a set of new job ID strings.
+    Every page is rendered: the listing is built client-side, so the HTML
+    shell (and any ETag on it) says nothing about which jobs it lists.
+    When a DriverPool is given, the next pages are loaded ahead on its
+    drivers while the current one is checked; pages are still inspected in
+    order, so the scan stops at the same page as the serial walk.
+    Returns a set of new integer job IDs.
     """
     new_found_ids = set()
-    page_num = 1
+    page_num = 0
     
-    print(f"Starting incremental scraping. Looking for new jobs not in {len(existing_ids)} existing IDs...")
+    log.info(f"Starting incremental scraping. Looking for new jobs not in {len(existing_ids)} existing IDs...")
     
-    while page_num <= max_pages:
-        # Construct URL for current page
-        if page_num == 1:
-            page_url = base_url
-        else:
-            page_url = f"{base_url}&page={page_num}"
-        
-        page_ids = scrape_jobs_from_page(driver, page_url)
-        
+    pages = _listing_pages(driver, pool, base_url, max_pages)
+    for page_num, page_ids in pages:
         # If no IDs found on this page, we've reached the end
         if not page_ids:
-            print(f"No job IDs found on page {page_num}. Reached end of available pages.")
+            log.info(f"No job IDs found on page {page_num}. Reached end of available pages.")
             break
         
         # Check if any of the page IDs are already known (intersection)
         known_ids_on_page = page_ids & existing_ids
         new_ids_on_page = page_ids - existing_ids
         
-        print(f"Page {page_num}: Found {len(page_ids)} total jobs")
-        print(f"  - New jobs: {len(new_ids_on_page)}")
-        print(f"  - Known jobs: {len(known_ids_on_page)}")
+        log.info(f"Page {page_num}: Found {len(page_ids)} total jobs")
+        log.info(f"  - New jobs: {len(new_ids_on_page)}")
+        log.info(f"  - Known jobs: {len(known_ids_on_page)}")
         
         # Add new IDs to our collection
         new_found_ids.update(new_ids_on_page)
         
         # If we found known IDs, we've reached content we've seen before
         if known_ids_on_page:
-            print(f"\n✅ Found {len(known_ids_on_page)} previously known job(s) on page {page_num}.")
-            print("This indicates we've reached content from previous scraping runs.")
-            print("Stopping incremental scraping here to avoid duplicates.")
+            log.info(f"\n✅ Found {len(known_ids_on_page)} previously known job(s) on page {page_num}.")
+            log.info("This indicates we've reached content from previous scraping runs.")
+            log.info("Stopping incremental scraping here to avoid duplicates.")
             break
-        
-        # Add delay between pages to be respectful
-        time.sleep(DELAY_BETWEEN_PAGES)
-        page_num += 1
+    pages.close()
     
-    print("\n🎯 Incremental scraping complete!")
-    print(f"📊 Total NEW job IDs found: {len(new_found_ids)}")
-    print(f"📄 Pages scraped: {page_num}")
+    log.info("\n🎯 Incremental scraping complete!")
+    log.info(f"📊 Total NEW job IDs found: {len(new_found_ids)}")
+    log.info(f"📄 Pages scraped: {page_num}")
     
     return new_found_ids
 
 
-def scrape_details(list_of_job_ids: List[str], driver) -> Dict[str, Any]:
+def append_json_entries(path: str, entries) -> bool:
+    """Append `entries` to the JSON array or object stored in `path` in place.
+
+    Only the new entries are written: the file is truncated just before its
+    closing bracket and the entries are written with the same two-space
+    layout `orjson.OPT_INDENT_2` produces, so the file stays valid JSON.
+    Pass a list to extend an array or a dict to extend an object.
+
+    Returns:
+        True on success; False when the file is missing or doesn't end with
+        the matching bracket, in which case nothing is changed and the
+        caller should rewrite the whole file.
+    """
+    opener, closer = (b"{", b"}") if isinstance(entries, dict) else (b"[", b"]")
+    items = entries.items() if isinstance(entries, dict) else entries
+    chunks = [
+        orjson.dumps(dict([item]) if isinstance(entries, dict) else [item], option=orjson.OPT_INDENT_2)[2:-2]
+        for item in items
+    ]
+    if not chunks:
+        return True
+    try:
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 4096))
+            tail = f.read().rstrip()
+            if not tail.endswith(closer):
+                return False
+            body = tail[:-1].rstrip()
+            if not body:
+                return False
+            # Offset of the first byte after the last entry (or the opener)
+            body_end = max(0, size - 4096) + len(body)
+            f.seek(body_end)
+            sep = b"\n" if body.endswith(opener) else b",\n"
+            f.write(sep + b",\n".join(chunks) + b"\n" + closer)
+            f.truncate()
+        return True
+    except OSError:
+        return False
+
+
+class JsonObjectWriter:
+    """Write a JSON object to disk one key at a time.
+
+    Each entry is serialized and flushed as soon as it is written, so only
+    the current record is held in memory and a crash leaves every finished
+    entry on disk. The output matches `orjson.dumps(obj, option=orjson.OPT_INDENT_2)`,
+    the layout `append_json_entries` extends.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._f = open(path, "wb")
+        self._f.write(b"{")
+
+    def write(self, key: str, value: Any) -> None:
+        # Dump a one-key object and strip its braces to get the indented entry
+        entry = orjson.dumps({key: value}, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)[1:-2]
+        self._f.write((b"," if self.count else b"") + entry)
+        self._f.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.write(b"\n}" if self.count else b"}")
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_from_trees(job: str, main_root, title_root) -> Dict[str, Any]:
+    """Build a job record from parsed main and title/location containers.
+
+    Each field in `JOB_FIELDS` is read straight from its container by class,
+    without first grouping every element's text.
+
+    Args:
+        job: Job id string.
+        main_root: lxml tree holding the main container, or None.
+        title_root: lxml tree holding the title/location container, or None.
+
+    Returns:
+        A dict of extracted fields (title, URL, location, etc.).
+    """
+    containers = {
+        "main_container": find_container(main_root, JOB_DETAIL_CLASSES["main_container"]),
+        "title_location_container": find_container(title_root, JOB_DETAIL_CLASSES["title_location_container"]),
+    }
+    texts_cache: Dict[tuple, List[str]] = {}
+    fields: Dict[str, str] = {}
+    for field, spec in JOB_FIELDS.items():
+        key = (spec["container"], spec["class"])
+        if key not in texts_cache:
+            texts_cache[key] = class_texts(containers[spec["container"]], JOB_DETAIL_CLASSES[spec["class"]])
+        texts = texts_cache[key]
+        if spec["index"] < len(texts):
+            fields[field] = texts[spec["index"]]
+        else:
+            log.warning("Could not find key='%s' idx=%d in %s.",
+                        JOB_DETAIL_CLASSES[spec["class"]], spec["index"], spec["container"])
+            fields[field] = ""
+
+    return {
+        "title": fields["title"],
+        "URL": BASE_URL + job,
+        "location": fields["location"],
+        "responsibilities": fields["responsibilities"],
+        "minimum_qualifications": fields["minimum_qualifications"],
+        "preferred_qualifications": fields["preferred_qualifications"],
+        "compensation": fields["compensation"]
+    }
+
+
+def parse_job_html(job: str, html_text: str) -> Dict[str, Any] | None:
+    """Extract a job record from raw page HTML, or None if it isn't rendered.
+
+    Pages served without the React-rendered containers return None so the
+    caller can fall back to the browser.
+    """
+    if not html_text:
+        return None
+    root = lxml_html.fromstring(html_text)
+    if not _CONTAINER_XP(root, c=JOB_DETAIL_CLASSES["main_container"]):
+        return None
+    return record_from_trees(job, root, root)
+
+
+async def fetch_job_page(session: httpx.AsyncClient, sem: asyncio.Semaphore, job: str):
+    """Download one job page over plain HTTP and parse it off the event loop.
+
+    Returns (job, record), where record is None when the page could not be
+    fetched or lacks the rendered job containers.
+    """
+    try:
+        async with sem:
+            r = await session.get(BASE_URL + job)
+        if r.status_code != 200:
+            return job, None
+        text = r.text
+    except httpx.HTTPError as e:
+        log.debug("HTTP fetch failed for job %s: %s", job, e)
+        return job, None
+    loop = asyncio.get_running_loop()
+    return job, await loop.run_in_executor(None, parse_job_html, job, text)
+
+
+async def fetch_job_pages(job_ids: List[str], concurrency: int = HTTP_CONCURRENCY) -> Dict[str, Any]:
+    """Fetch and parse many job pages concurrently over one HTTP session.
+
+    Returns a mapping job_id -> record for the pages that parsed; the rest
+    are left out.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=HTTP_TIMEOUT, follow_redirects=True,
+                                 headers={"User-Agent": USER_AGENT}) as session:
+        results = await asyncio.gather(*(fetch_job_page(session, sem, job) for job in job_ids))
+    return {job: rec for job, rec in results if rec is not None}
+
+
+def scrape_job_detail(driver, job: str) -> Dict[str, Any]:
+    """Load a single job detail page and extract its structured fields.
+
+    Args:
+        driver: Selenium WebDriver instance used to load the page.
+        job: Job id string.
+
+    Returns:
+        A dict of extracted fields (title, URL, location, etc.).
+    """
+    # Gentle pacing: at least DELAY_BETWEEN_JOBS between loads on this driver
+    pace(_LAST_DETAIL_LOAD.get(driver, 0.0), DELAY_BETWEEN_JOBS)
+    _LAST_DETAIL_LOAD[driver] = time.monotonic()
+    job_url = BASE_URL + job
+    log.info("Job ID %s: %s", job, job_url)
+    driver.get(job_url)
+    try:
+        # Continue as soon as React has rendered the title
+        driver_wait(driver, REACT_RENDER_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, TITLE_SELECTOR))
+        )
+    except TimeoutException:
+        pass
+
+    # Parse only the two container fragments rather than the full page source
+    main_html, title_html = driver.execute_script(
+        _CONTAINERS_HTML_JS,
+        JOB_DETAIL_CLASSES["main_container"],
+        JOB_DETAIL_CLASSES["title_location_container"],
+    ) or ("", "")
+
+    return record_from_trees(
+        job,
+        lxml_html.fromstring(main_html) if main_html else None,
+        lxml_html.fromstring(title_html) if title_html else None,
+    )
+
+
+def scrape_details(list_of_job_ids: List[str], driver, workers: int = DETAIL_WORKERS,
+                   writer: JsonObjectWriter = None, pool=None) -> Dict[str, Any]:
     """Fetch job detail pages for a list of job IDs and extract structured fields.
 
-    For each job ID the function builds the job URL (using `BASE_URL`), loads
-    the page with Selenium, waits briefly for React to render, then uses
-    BeautifulSoup and helper functions to extract fields such as title,
-    location, qualifications and compensation.
+    All pages are first requested concurrently over plain HTTP and parsed
+    with lxml. Jobs whose HTML lacks the rendered containers fall back to
+    Selenium: the page is loaded in a browser, which waits until React has
+    rendered the title before the fields are extracted.
+
+    Browser pages are loaded by several browsers in parallel, borrowed from
+    `pool` when given. Otherwise a temporary pool lends the given driver plus
+    up to `workers - 1` extra drivers that are quit at the end. Each driver
+    is used by one thread at a time.
 
     Args:
         list_of_job_ids: Iterable of job id strings to fetch.
-        driver: Selenium WebDriver instance used to load pages.
+        driver: Selenium WebDriver instance used to load pages (may be None
+            when `pool` is given).
+        workers: Number of browsers loading pages concurrently.
+        writer: Optional JsonObjectWriter; when given, each record is streamed
+            to it as soon as it is scraped instead of being kept in memory.
+        pool: Optional DriverPool shared with other scraping phases.
 
     Returns:
         A dict mapping job_id -> extracted fields (title, URL, location, etc.).
+        Empty when `writer` is given.
     """
     results: Dict[str, Any] = {}
+    job_ids = list(list_of_job_ids)
+    if not job_ids:
+        return results
+
+    # Identical titles, locations and pay bands across jobs share one string
+    interned: Dict[str, str] = {}
+
+    def emit(job: str, record: Dict[str, Any]):
+        for field in _INTERNED_FIELDS:
+            value = record.get(field)
+            if isinstance(value, str):
+                record[field] = interned.setdefault(value, value)
+        if writer is not None:
+            writer.write(job, record)
+        else:
+            results[job] = record
+
+    prefetched = asyncio.run(fetch_job_pages(job_ids))
+    for job in job_ids:
+        if job in prefetched:
+            emit(job, prefetched[job])
+    job_ids = [job for job in job_ids if job not in prefetched]
+    log.info("Parsed %d job pages over HTTP; %d need the browser", len(prefetched), len(job_ids))
+    if not job_ids:
+        return results
+
+    from utils.driver_pool import DriverPool  # imported here: driver_pool imports this module
+
+    own_pool = pool is None
+    if own_pool:
+        pool = DriverPool(size=min(workers, len(job_ids)), seed=[driver] if driver is not None else [])
+
+    def fetch(job: str):
+        with pool.acquire() as d:
+            try:
+                return job, scrape_job_detail(d, job)
+            except (TimeoutException, StaleElementReferenceException, WebDriverException) as e:
+                log.warning("Error scraping job %s: %s", job, e)
+                return job, None
+
     try:
-        for job in list_of_job_ids:
-            time.sleep(DELAY_BETWEEN_JOBS)  # gentle pacing
-            job_url = BASE_URL + job
-            print(f"\n=== Job ID {job} ===\nURL: {job_url}\n")
-            driver.get(job_url)
-            time.sleep(REACT_RENDER_DELAY)  # allow React to render
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-
-            # Extract data using class names from config
-            items_1 = extract_from_div(soup, JOB_DETAIL_CLASSES["main_container"])
-            items_2 = extract_from_div(soup, JOB_DETAIL_CLASSES["title_location_container"])
-
-            # Extract fields using config mapping
-            title = safe_pick(items_2, JOB_DETAIL_CLASSES["title_class"], 0, label="title/location block")
-            location = safe_pick(items_2, JOB_DETAIL_CLASSES["location_class"], 0, label="title/location block")
-
-            # The three stacked sections:
-            responsibilities = safe_pick(items_1, JOB_DETAIL_CLASSES["sections_class"], 0, label="sections")
-            minimum_qualifications = safe_pick(items_1, JOB_DETAIL_CLASSES["sections_class"], 1, label="sections")
-            preferred_qualifications = safe_pick(items_1, JOB_DETAIL_CLASSES["sections_class"], 2, label="sections")
-
-            # Compensation
-            compensation = safe_pick(items_1, JOB_DETAIL_CLASSES["compensation_class"], 1, label="compensation")
-
-            results[job] = {
-                "title": title,
-                "URL": job_url,
-                "location": location,
-                "responsibilities": responsibilities,
-                "minimum_qualifications": minimum_qualifications,
-                "preferred_qualifications": preferred_qualifications,
-                "compensation": compensation
-            }
-    except (TimeoutException, StaleElementReferenceException, json.JSONDecodeError) as e:
-        print("Error:", e)
+        with ThreadPoolExecutor(max_workers=pool.size) as ex:
+            for job, record in ex.map(fetch, job_ids):
+                if record is not None:
+                    emit(job, record)
+    finally:
+        if own_pool:
+            pool.close()
     return results
 
 def cleanup_old_job_files(save_path: str) -> int:
@@ -503,14 +943,14 @@ def cleanup_old_job_files(save_path: str) -> int:
                     if file_date < cutoff_date:
                         os.remove(filepath)
                         files_removed += 1
-                        print(f"Removed old file: {filename} (date: {file_date})")
+                        log.info(f"Removed old file: {filename} (date: {file_date})")
         except (ValueError, IndexError, KeyError) as e:
-            print(f"Could not parse date from filename {filename}: {e}")
+            log.warning(f"Could not parse date from filename {filename}: {e}")
             continue
     
     if files_removed > 0:
-        print(f"Removed {files_removed} old job files")
+        log.info(f"Removed {files_removed} old job files")
     else:
-        print("No old job files found to remove")
+        log.info("No old job files found to remove")
     
     return files_removed
@@ -5,8 +5,9 @@ This module contains all configuration constants, URLs, file paths,
 scraping settings, and filtering rules used by the scraper.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import json
+import os
 
 with open("config.json", encoding="utf-8") as f:
     config = json.load(f)
@@ -28,7 +29,44 @@ WAIT_PER_PAGE = 25
 DELAY_AFTER_NEXT = 1.2
 SLEEP_BETWEEN = (2.0, 5.0)  # (min, max) delay between detail requests
 MAX_RETRIES = 2
-RESTART_EVERY = 10  # Restart browser every N jobs
+DETAIL_WORKERS = int(os.getenv("MS_DETAIL_WORKERS", "3"))  # Chrome instances scraping detail pages in parallel
+CHECKPOINT_EVERY = 100  # Rewrite the full details JSON every N records; each record is also logged as it arrives
+PREFER_HTTP = True  # Build detail records from the page's JSON-LD when complete, skipping Chrome
+REFRESH_DETAILS = os.getenv("MS_REFRESH_DETAILS", "") == "1"  # Re-check saved records with conditional GETs
+SERIALIZE_PROCESSES_MIN = 32  # Serialize jobs_by_date buckets in a process pool from this many files up
+PAGE_LOAD_STRATEGY = "eager"  # driver.get returns at DOMContentLoaded; the explicit waits cover rendering
+
+# URL patterns Chrome drops via the DevTools protocol: images, fonts and trackers.
+# Stylesheets stay enabled because the detail script reads innerText, which depends on layout.
+BLOCKED_URL_PATTERNS: List[str] = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+# HTTP detail prefetch settings
+USER_AGENT = "MS-Careers-Scraper/1.5 (+you@example.com)"
+HTTP_TIMEOUT = 25  # seconds per HTTP request
+MAX_CONCURRENCY = 8  # concurrent HTTP detail requests
+HTTP_RETRIES = 2  # retries for transient gateway errors
+HTTP_BACKOFF = 0.3  # seconds, doubled after each retry
+RETRY_STATUSES = (502, 503, 504)
+
+# Parsed detail pages cached on disk (outside the repo) between runs; the
+# workflow persists this directory with actions/cache
+HTTP_CACHE_PATH = os.getenv(
+    "MS_HTTP_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "ms-jobs-scraper", "details.sqlite"),
+)
+HTTP_CACHE_TTL = 24 * 3600  # seconds before a cached page is revalidated
+
+# JSON databases at least this large are parsed straight from a memory map
+MMAP_MIN_BYTES = 1 << 20
+
+# New job ids are appended to "<DB_PATH>.wal.jsonl"; the log is folded back into
+# DB_PATH once it grows past this fraction of the database's size
+WAL_SUFFIX = ".wal.jsonl"
+WAL_COMPACT_RATIO = 0.25
 
 # Optional: local chromedriver path
 LOCAL_CHROMEDRIVER = ""
@@ -84,8 +122,8 @@ AVOID_RULES: Dict[str, Dict[str, List[str]]] = {
     }
 }
 
-SCANNABLE_FIELDS: List[str] = [
+SCANNABLE_FIELDS: Tuple[str, ...] = (
     "title", "locations", "travel", "qualifications_text",
     "required_qualifications_text", "preferred_qualifications_text",
     "other_requirements_text", "date_posted",
-]
+)
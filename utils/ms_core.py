@@ -1,20 +1,37 @@
 
 import os
 import re
-import json
 import time
-import tempfile
+import asyncio
+import hashlib
+import io
+import itertools
+import functools
+import operator
+import mmap
+import queue
+import sqlite3
 import datetime as dt
-import requests
+import orjson
+import httpx
 import glob
-from bs4 import BeautifulSoup, NavigableString
+from lxml import etree, html as lxml_html
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from typing import Dict, Any, List
-from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import random
 import contextlib
 import subprocess
 
+try:
+    import ahocorasick  # pyahocorasick; optional, filter_jobs falls back to regexes
+except ImportError:
+    ahocorasick = None
+try:
+    from trieregex import TrieRegEx  # optional, compiled_rules falls back to flat alternations
+except ImportError:
+    TrieRegEx = None
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -26,9 +43,6 @@ from selenium.common.exceptions import (
     WebDriverException,
     StaleElementReferenceException,
     TimeoutException,
-    ElementClickInterceptedException,
-    JavascriptException,
-    InvalidElementStateException,
 )
 
 # ==================== CONFIGURATION ====================
@@ -42,16 +56,35 @@ from utils.ms_config import (
     SEARCH_URL,
     DELAY_AFTER_NEXT,
     LABELS,
-    RESTART_EVERY,
+    DETAIL_WORKERS,
+    PREFER_HTTP,
+    CHECKPOINT_EVERY,
+    REFRESH_DETAILS,
     MAX_RETRIES,
     SCANNABLE_FIELDS,
-    AVOID_RULES
+    AVOID_RULES,
+    USER_AGENT,
+    HTTP_TIMEOUT,
+    MAX_CONCURRENCY,
+    HTTP_RETRIES,
+    HTTP_BACKOFF,
+    RETRY_STATUSES,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_TTL,
+    MMAP_MIN_BYTES,
+    WAL_SUFFIX,
+    WAL_COMPACT_RATIO,
+    SERIALIZE_PROCESSES_MIN,
+    PAGE_LOAD_STRATEGY,
+    BLOCKED_URL_PATTERNS,
 )
 
 # ==================== REGEX PATTERNS ====================
 
 JOB_ID_FROM_ARIA = re.compile(r"Job item\s+(\d+)")
 ISO_DATE_RE = re.compile(r"(20\d{2})-(\d{2})-(\d{2})")
+JOB_URL_ID_RE = re.compile(r"/job/(\d+)")
+HIGH_PAY_REGION_RE = re.compile(r"San\s*Francisco\s*Bay|New\s*York\s*City", re.I)
 USD_RANGE = re.compile(r"USD\s*\$\s*[\d,]+\s*-\s*\$\s*[\d,]+", re.I)
 PAY_START = re.compile(
     r"(typical\s+base\s+pay\s+range|base\s+pay\s+range\s+for\s+this\s+role|benefits\s+and\s+pay\s+information|USD\s*\$\s*[\d,]+\s*-\s*\$\s*[\d,]+)",
@@ -60,6 +93,23 @@ PAY_START = re.compile(
 REQ_RE = re.compile(r"\bRequired\s+Qualifications\b", re.I)
 PREF_RE = re.compile(r"\bPreferred\s+Qualifications\b", re.I)
 OTHER_RE = re.compile(r"\bOther\s+Requirements?\b", re.I)
+LDJSON_SCRIPT_RE = re.compile(r"<script[^>]*application/ld\+json[^>]*>(.*?)</script>", re.S | re.I)
+TODAY_TEXT_RE = re.compile(r">[^<]*Today")
+# <script>/<style> elements, dropped before looking for visible "Today" text
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+QUAL_HEADING_RE = re.compile(r"^\s*Qualifications:?\s*$", re.I | re.M)
+RESP_HEADING_RE = re.compile(r"^\s*Responsibilities:?\s*$", re.I | re.M)
+# Raw date_posted text -> filename token ("Oct 1, 2026" -> "Oct_1_2026")
+_DATE_TRANS = str.maketrans({"-": "_", " ": "_", ",": None})
+# Lowercase English month names for date tokens, independent of the host locale
+_MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+           "august", "september", "october", "november", "december")
+# Detail fields copied into the jobs_by_date files, in output order
+_JOB_FILE_FIELDS = (
+    "title", "locations", "travel", "date_posted", "url", "required_qualifications_text",
+    "preferred_qualifications_text", "other_requirements_text", "pay_ranges",
+)
+_JOB_FILE_GET = operator.itemgetter(*_JOB_FILE_FIELDS)
 
 # ==================== UTILITIES ====================
 
@@ -76,7 +126,7 @@ def norm(s: str | None) -> str:
     Returns:
         Normalized string with collapsed whitespace.
     """
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return " ".join((s or "").split())
 
 def sleep_a_bit():
     """Pause execution for a short, random duration to avoid hammering servers.
@@ -88,12 +138,17 @@ def sleep_a_bit():
     time.sleep(random.uniform(*SLEEP_BETWEEN))
     time.sleep(random.uniform(*SLEEP_BETWEEN))
 
+# What parse_date returns for unparseable input; compare with `is`
+_PARSE_FAIL = dt.datetime.max
+
+@functools.lru_cache(maxsize=4096)
 def parse_date(date_str):
     """Parse a date string into a datetime object.
 
     Tries a few common formats used in job postings. If parsing fails or the
     input is falsy, returns datetime.max to indicate an unknown/future date
-    which sorts after real dates.
+    which sorts after real dates. Results are memoized per string, since
+    many jobs share the same posted date.
 
     Args:
         date_str: String containing a date to parse.
@@ -102,16 +157,29 @@ def parse_date(date_str):
         datetime.datetime instance parsed from the string or datetime.max.
     """
     if not date_str:
-        return dt.datetime.max
+        return _PARSE_FAIL
     for fmt in ("%b %d, %Y", "%Y-%m-%d", "%b %d, %Y."):
         try:
             return dt.datetime.strptime(date_str.strip(), fmt)
         except ValueError:
             continue
-    return dt.datetime.max
+    return _PARSE_FAIL
 
 # ==================== PERSISTENCE ====================
 
+def read_json_file(path: str):
+    """Parse the JSON file at `path` with orjson.
+
+    Files of at least `MMAP_MIN_BYTES` are memory-mapped and parsed from the
+    mapping, so no separate bytes copy of the file is held while parsing;
+    smaller files are simply read.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
 def load_db(path: str) -> list:
     """Load a JSON database file and return a list of job IDs or keys.
 
@@ -128,15 +196,14 @@ def load_db(path: str) -> list:
     if not os.path.exists(path):
         return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(path)
         if isinstance(data, list):
             return data
         # If it's a dict, return its keys as a list
         if isinstance(data, dict):
             return list(data.keys())
         return []
-    except (json.JSONDecodeError, OSError):
+    except (orjson.JSONDecodeError, OSError):
         return []
 
 def load_db_atomic(path: str) -> dict:
@@ -155,8 +222,7 @@ def load_db_atomic(path: str) -> dict:
     if not os.path.exists(path):
         return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(path)
         if isinstance(data, dict):
             return data
         # Convert list to dict keyed by job_id or url
@@ -166,29 +232,109 @@ def load_db_atomic(path: str) -> dict:
             if key:
                 out[str(key)] = row
         return out
-    except (json.JSONDecodeError, OSError):
+    except (orjson.JSONDecodeError, OSError):
         return {}
 
 def save_db_atomic(path: str, data):
     """Atomically save data to a JSON file.
 
-    Writes data to a temporary file in the same directory and then renames it
-    into place to avoid partial writes. Sets are converted to lists before
-    serialization.
+    Serializes with orjson, keeping the data's own key order, and hands the
+    payload to `write_bytes`, which writes it to a temporary file in the same
+    directory and renames it into place to avoid partial writes. Sets are
+    converted to sorted lists before serialization.
 
     Args:
         path: Destination file path.
         data: Data to serialize (list, set, or dict).
     """
     os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(prefix="jobs_", suffix=".json", 
-                                   dir=os.path.dirname(os.path.abspath(path)))
-    os.close(fd)
-    # Convert set to list for JSON serialization
+    # Convert set to a (deterministically ordered) list for JSON serialization
     if isinstance(data, set):
-        data = list(data)
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        data = sorted(data, key=lambda x: (len(str(x)), str(x)))
+    write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+def append_wal(path: str, rows) -> None:
+    """Append `rows` to the write-ahead log of the database at `path`.
+
+    Each row is written as one JSON line through a 1 MiB buffer and the log
+    is fsynced once at the end, so a run writes only its new rows instead of
+    the whole database.
+    """
+    if not rows:
+        return
+    wal = path + WAL_SUFFIX
+    # Start on a fresh line if an interrupted run left a torn one behind
+    torn = False
+    if os.path.exists(wal) and os.path.getsize(wal):
+        with open(wal, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"
+    with io.BufferedWriter(io.FileIO(wal, "a"), buffer_size=1 << 20) as f:
+        if torn:
+            f.write(b"\n")
+        for row in rows:
+            f.write(orjson.dumps(row) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def read_wal(path: str) -> list:
+    """Return the rows logged for the database at `path`, oldest first.
+
+    A torn last line (from an interrupted run) is ignored.
+    """
+    try:
+        with open(path + WAL_SUFFIX, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+    rows = []
+    for line in lines:
+        try:
+            rows.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+    return rows
+
+def load_ids(path: str) -> list:
+    """Return the ids stored in the JSON list at `path` plus those in its log.
+
+    Ids are returned as strings, the form listing cards and the details DB
+    use; older files hold a mix of ints and strings.
+    """
+    return list(dict.fromkeys(str(x) for x in itertools.chain(load_db(path), read_wal(path))))
+
+def compact_db(path: str, force: bool = False) -> bool:
+    """Fold the write-ahead log of `path` into the JSON file itself.
+
+    Only happens once the log exceeds WAL_COMPACT_RATIO of the database's
+    size, unless `force` is set. Returns True if the database was rewritten.
+    """
+    wal = path + WAL_SUFFIX
+    if not os.path.exists(wal):
+        return False
+    db_size = os.path.getsize(path) if os.path.exists(path) else 0
+    if not force and os.path.getsize(wal) <= db_size * WAL_COMPACT_RATIO:
+        return False
+    save_db_atomic(path, load_ids(path))
+    os.remove(wal)
+    return True
+
+def write_bytes(path: str, data: bytes) -> None:
+    """Atomically replace `path` with `data`, written through a raw file descriptor.
+
+    The payload is already fully serialized, so it goes out in one write
+    call (looping only if the OS accepts a partial write) to a temporary
+    file that is synced and then renamed into place.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
     os.replace(tmp_path, path)
 
 def upsert_rows(db: dict, rows: list) -> int:
@@ -242,9 +388,6 @@ def upsert_record(rec: Dict[str, Any], db: Dict[str, Any]) -> None:
 
 # ==================== SELENIUM SETUP ====================
 
-session = requests.Session()
-session.headers.update({"User-Agent": "MS-Careers-Scraper/1.5 (+you@example.com)"})
-
 # utils/ms_core.py
 
 import subprocess
@@ -259,11 +402,26 @@ def _is_file(p: str) -> bool:
     except Exception:
         return False
 
+def block_heavy_requests(driver) -> None:
+    """Drop image, font and tracker requests in `driver` via the DevTools protocol.
+
+    Failures are ignored so the driver still works, just without the savings.
+    """
+    if not BLOCKED_URL_PATTERNS:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except (WebDriverException, AttributeError):
+        pass
+
 def launch_chrome():
     """Create and return a configured Selenium Chrome WebDriver for scraping.
     Uses Selenium Manager; never uses any stale chromedriver on PATH.
+    Pages load with PAGE_LOAD_STRATEGY and skip BLOCKED_URL_PATTERNS.
     """
     opts = ChromeOptions()
+    opts.page_load_strategy = PAGE_LOAD_STRATEGY
     opts.add_argument("--headless=new")
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
@@ -295,10 +453,12 @@ def launch_chrome():
 
     if use_local:
         from selenium.webdriver.chrome.service import Service
-        return webdriver.Chrome(service=Service(globals()["LOCAL_CHROMEDRIVER"], log_path=os.devnull), options=opts)
-
-    # IMPORTANT: do NOT pass Service() here
-    return webdriver.Chrome(options=opts)
+        driver = webdriver.Chrome(service=Service(globals()["LOCAL_CHROMEDRIVER"], log_path=os.devnull), options=opts)
+    else:
+        # IMPORTANT: do NOT pass Service() here
+        driver = webdriver.Chrome(options=opts)
+    block_heavy_requests(driver)
+    return driver
 
 
 # ==================== JOB LISTING SCRAPER ====================
@@ -315,177 +475,111 @@ def with_page(url: str, page: int) -> str:
     parts[4] = urlencode(q, doseq=True)
     return urlunparse(parts)
 
-def find_cards(driver):
-    """Locate job listing card elements on the current page.
-
-    Returns the list of found Selenium elements representing job cards.
-    """
-    return driver.find_elements(By.CSS_SELECTOR, 'div[role="listitem"]')
+# Job id of every listing card (from its aria-label, else its outerHTML), in one call;
+# the regex mirrors JOB_ID_FROM_ARIA so only the ids travel back over the wire
+_CARD_IDS_JS = (
+    "return Array.from(document.querySelectorAll('div[role=\"listitem\"]'), c => {"
+    " const re = /Job item\\s+(\\d+)/;"
+    " const m = (c.getAttribute('aria-label') || '').match(re) || c.outerHTML.match(re);"
+    " return m ? m[1] : null; });"
+)
 
-def title_from_card(card):
-    """Extract a job title string from a job card element.
+def card_job_ids(driver) -> List[str | None]:
+    """Return the job id of every listing card on the page, in page order.
 
-    Tries to use an <h2> element if present; otherwise falls back to splitting
-    the card text and returning the first non-empty line.
+    All ids are extracted in the page with a single script call instead of
+    per-card get_attribute/outerHTML round-trips; cards without an id
+    yield None.
     """
-    try:
-        h2 = card.find_element(By.CSS_SELECTOR, "h2")
-        t = (h2.text or "").strip()
-        if t:
-            return t
-    except NoSuchElementException:
-        pass
-    txt = (card.text or "").strip()
-    return txt.splitlines()[0].strip() if txt else None
+    return driver.execute_script(_CARD_IDS_JS) or []
 
-def job_id_from_card(card):
-    """Extract a job id from a card element using aria-label or outerHTML.
+def jsonld_postings(html_text: str):
+    """Yield the JobPosting objects found in the page's JSON-LD blocks.
 
-    The function first attempts to parse the aria-label text, then falls
-    back to examining the card's outerHTML. Returns an integer job id or
-    None if not found.
+    Script bodies are pulled out with `LDJSON_SCRIPT_RE` rather than a full
+    HTML parse; blocks that aren't valid JSON are skipped.
     """
-    aria = card.get_attribute("aria-label") or ""
-    m = JOB_ID_FROM_ARIA.search(aria)
-    if m:
-        return m.group(1)
-    try:
-        outer = card.parent.execute_script("return arguments[0].outerHTML;", card)
-    except WebDriverException:
-        outer = ""
-    m2 = JOB_ID_FROM_ARIA.search(outer or "")
-    return int(m2.group(1)) if m2 else None
-
-def link_from_card(card, job_id):
-    """Return the job detail URL present on the card or a generated fallback.
+    return postings_from_ldjson(m.group(1) for m in LDJSON_SCRIPT_RE.finditer(html_text))
 
-    If the card contains an anchor with the expected job URL it is returned;
-    otherwise a fallback URL is constructed using the provided `job_id`.
-    """
-    try:
-        a = card.find_element(By.CSS_SELECTOR, 'a[href*="/global/en/job/"]')
-        href = a.get_attribute("href")
-        if href:
-            return href
-    except NoSuchElementException:
-        pass
-    return f"https://jobs.careers.microsoft.com/global/en/job/{job_id}/" if job_id else None
+def postings_from_ldjson(blocks):
+    """Yield the JobPosting objects from an iterable of JSON-LD script bodies."""
+    for block in blocks:
+        try:
+            data = orjson.loads(block)
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and item.get("@type") in {"JobPosting", "Posting"}:
+                yield item
 
-def parse_date_posted_from_detail(html_text):
+def parse_date_posted_from_detail(html_text, postings=None):
     """Extract the job's posted date from HTML using JSON-LD or heuristics.
 
-    The function checks JSON-LD blocks for JobPosting data first, then
-    falls back to regex searching, and finally looks for the word "Today"
-    to return today's date.
+    The function checks for a `"datePosted"` value in the raw HTML first,
+    then JSON-LD blocks for JobPosting data, then falls back to regex
+    searching, and finally looks for the word "Today" in the page text to
+    return today's date. The HTML is only scanned with regexes; no parse
+    tree is built.
 
     Args:
         html_text: Full HTML text of a job detail page.
+        postings: JobPosting objects already decoded from `html_text`, so
+            its JSON-LD isn't scanned again.
 
     Returns:
         ISO-formatted date string (YYYY-MM-DD) or None if not found.
     """
-    soup = BeautifulSoup(html_text, "html.parser")
-
-    # Try JSON-LD first
-    for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        raw = tag.string or ""
-        try:
-            data = json.loads(raw)
-        except ValueError:
-            continue
-        items = data if isinstance(data, list) else [data]
-        for item in items:
-            if isinstance(item, dict) and item.get("@type") in {"JobPosting", "Posting"}:
-                dp = item.get("datePosted") or item.get("dateCreated") or item.get("dateModified")
-                if dp:
-                    m = ISO_DATE_RE.search(dp)
-                    if m:
-                        return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
+    # Fast path: an ISO date right after a "datePosted" key
+    at = html_text.find('"datePosted"')
+    if at >= 0:
+        m = ISO_DATE_RE.search(html_text, at, at + 64)
+        if m:
+            return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
+
+    # Try JSON-LD
+    for item in jsonld_postings(html_text) if postings is None else postings:
+        dp = item.get("datePosted") or item.get("dateCreated") or item.get("dateModified")
+        if dp:
+            m = ISO_DATE_RE.search(str(dp))
+            if m:
+                return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
 
     # Fallback to regex search
     m2 = ISO_DATE_RE.search(html_text)
     if m2:
         return f"{m2.group(1)}-{m2.group(2)}-{m2.group(3)}"
 
-    # Check for "Today"
-    text = soup.get_text(" ", strip=True)
-    if "Today" in text:
+    # Check for "Today" in a visible text node, not inside inline JS or JSON-LD
+    if TODAY_TEXT_RE.search(SCRIPT_STYLE_RE.sub("", html_text)):
         return dt.date.today().isoformat()
     return None
 
-def click_next_if_possible(driver) -> bool:
-    """Attempt to click a visible, enabled pagination "Next" control.
+def display_date(iso_date: str | None) -> str | None:
+    """Return an ISO date in the "Oct 1, 2026" form the rendered page shows.
 
-    Tries several selectors to locate the Next button, ensures it is visible
-    and not disabled, clicks it and returns True. Returns False if no
-    suitable control is found.
+    Records built over HTTP use this so the details DB holds one date
+    format whichever way a page was scraped. Anything that isn't an ISO
+    date is returned unchanged.
     """
-    selectors = [
-        (By.CSS_SELECTOR, 'button[aria-label*="Next"]'),
-        (By.XPATH, "//button[(contains(., 'Next') or contains(@aria-label, 'Next'))]"),
-        (By.XPATH, "//a[(contains(., 'Next') or contains(@aria-label, 'Next'))]")
-    ]
-
-    for by, sel in selectors:
-        try:
-            # use find_elements to avoid raising when element is absent
-            candidates = driver.find_elements(by, sel)
-            if not candidates:
-                continue
-            for btn in candidates:
-                try:
-                    if not btn.is_displayed():
-                        continue
-                    if btn.get_attribute("disabled") or btn.get_attribute("aria-disabled") == "true":
-                        continue
-                    # Try a normal click first, fallback to JS click if needed
-                    try:
-                        btn.click()
-                    except (ElementClickInterceptedException, InvalidElementStateException, WebDriverException):
-                        try:
-                            driver.execute_script("arguments[0].click();", btn)
-                        except (JavascriptException, WebDriverException):
-                            # If clicking this candidate failed, try next
-                            continue
-                    return True
-                except (StaleElementReferenceException, WebDriverException):
-                    # Element went stale or other webdriver issue - try next candidate
-                    continue
-        except (WebDriverException, JavascriptException):
-            # Catch any unexpected errors for robustness and try the next selector
-            continue
-    return False
-
-def wait_for_new_page(driver, prev_ids, timeout=12) -> bool:
-    """Wait until the job listing cards change after navigating pagination.
-
-    Polls the page until new card ids appear or the number of cards changes
-    compared to `prev_ids`. Returns True if a change was detected within the
-    timeout, otherwise False.
-    """
-    t0 = time.time()
-    last_count = len(prev_ids)
-    while time.time() - t0 < timeout:
-        time.sleep(0.8)
-        cards = find_cards(driver)
-        # No need to set protected member _parent; pass driver as needed
-        curr_ids = set()
-        for c in cards:
-            jid = job_id_from_card(c)
-            if jid:
-                curr_ids.add(jid)
-        if len(cards) != last_count or (curr_ids - prev_ids):
-            return True
-    return False
+    try:
+        d = dt.date.fromisoformat(iso_date or "")
+    except ValueError:
+        return iso_date
+    return f"{_MONTHS[d.month - 1][:3].title()} {d.day}, {d.year}"
 
-def scrape_paginated(max_pages=MAX_PAGES, seen_global_ids=None) -> List[Dict[str, Any]]:
+def scrape_paginated(max_pages=MAX_PAGES, seen_global_ids=None, driver=None) -> List[Dict[str, Any]]:
     """Scrape multiple pages of job listings from the configured SEARCH_URL.
 
-    Navigates pagination using the site's controls when possible and falls
-    back to constructing page URLs. Returns a tuple of (new_ids_list,
-    seen_global_ids_set).
+    Each page is loaded directly from its `pg=` URL. Returns a tuple of
+    (new_ids_list, seen_global_ids_set).
+
+    A `driver` passed in is used and left running so the caller can reuse
+    it for the detail pages; otherwise a browser is launched and quit here.
     """
-    driver = launch_chrome()
+    own_driver = driver is None
+    if own_driver:
+        driver = launch_chrome()
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
     wait = WebDriverWait(driver, WAIT_PER_PAGE)
 
@@ -502,13 +596,11 @@ def scrape_paginated(max_pages=MAX_PAGES, seen_global_ids=None) -> List[Dict[str
     page_already_seen = False
 
     while current_page <= max_pages:
-        cards = find_cards(driver)
+        card_ids = card_job_ids(driver)
 
-        print(f"[PAGE {current_page}] cards found: {len(cards)}")
+        print(f"[PAGE {current_page}] cards found: {len(card_ids)}")
 
-        page_ids = set()
-        for card in cards:
-            jid = job_id_from_card(card)
+        for jid in card_ids:
             if jid:
                 if jid in seen_global_ids:
                     page_already_seen = True
@@ -518,37 +610,22 @@ def scrape_paginated(max_pages=MAX_PAGES, seen_global_ids=None) -> List[Dict[str
                 seen_global_ids.add(jid)
 
         # Check if we're done (fewer than 20 cards)
-        if len(cards) < 20 or page_already_seen:
+        if len(card_ids) < 20 or page_already_seen:
             break
 
-        # Try to go to next page
-        clicked = click_next_if_possible(driver)
-        if clicked:
-            changed = wait_for_new_page(driver, page_ids, timeout=12)
-            if not changed:
-                next_url = with_page(SEARCH_URL, current_page + 1)
-                driver.get(next_url)
-                try:
-                    WebDriverWait(driver, WAIT_PER_PAGE).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div[role="listitem"]'))
-                    )
-                except (TimeoutException, WebDriverException):
-                    # Timeout waiting for elements or other webdriver error
-                    pass
-        else:
-            next_url = with_page(SEARCH_URL, current_page + 1)
-            driver.get(next_url)
-            try:
-                WebDriverWait(driver, WAIT_PER_PAGE).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div[role="listitem"]'))
-                )
-            except (TimeoutException, WebDriverException):
-                pass
+        # Load the next page directly through its pg= URL
+        driver.get(with_page(SEARCH_URL, current_page + 1))
+        try:
+            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div[role="listitem"]')))
+        except (TimeoutException, WebDriverException):
+            # Timeout waiting for elements or other webdriver error
+            pass
 
         time.sleep(DELAY_AFTER_NEXT)
         current_page += 1
 
-    driver.quit()
+    if own_driver:
+        driver.quit()
     return new_ids, seen_global_ids
 
 # ==================== DETAIL SCRAPER ====================
@@ -561,79 +638,271 @@ def extract_pay_ranges(text: str) -> List[Dict[str, str]]:
     Duplicates are removed preserving order.
     """
     spans = []
+    n = len(text)
     for m in USD_RANGE.finditer(text):
         s, e = m.span()
-        ctx = text[max(0, s-140): min(len(text), e+140)]
+        # pos/endpos bound the search to the surrounding context without slicing
         region = "U.S."
-        if re.search(r"San\s*Francisco\s*Bay|New\s*York\s*City", ctx, re.I):
+        if HIGH_PAY_REGION_RE.search(text, max(0, s-140), min(n, e+140)):
             region = "SF Bay Area / NYC"
         spans.append({"region": region, "range": m.group(0)})
-    
-    # Remove duplicates
-    uniq, seen = [], set()
-    for r in spans:
-        key = (r["region"], r["range"])
-        if key not in seen:
-            seen.add(key)
-            uniq.append(r)
-    return uniq
-
-def extract_locations_jsonld(html_text: str) -> List[str]:
+
+    # Remove duplicates; dict insertion order keeps the first occurrence's place
+    return list({(r["region"], r["range"]): r for r in spans}.values())
+
+def extract_locations_jsonld(html_text: str, postings=None) -> List[str]:
     """Extract location(s) from JSON-LD <script type="application/ld+json"> blocks.
 
     Returns a deduplicated list of human-readable location strings built from
-    the JSON-LD `jobLocation` address fields when present.
+    the JSON-LD `jobLocation` address fields when present. `postings` may
+    hold the page's already decoded JobPosting objects.
     """
+    return locations_from_postings(jsonld_postings(html_text) if postings is None else postings)
+
+def locations_from_postings(postings) -> List[str]:
+    """Return the deduplicated `jobLocation` address strings of `postings`."""
     out = []
-    soup = BeautifulSoup(html_text, "html.parser")
-    for tag in soup.find_all("script", {"type": "application/ld+json"}):
-        try:
-            data = json.loads(tag.string or "")
-        except (ValueError, TypeError, json.JSONDecodeError):
-            # Skip invalid JSON-LD blocks
-            continue
-        items = data if isinstance(data, list) else [data]
-        for it in items:
-            if isinstance(it, dict) and it.get("@type") in {"JobPosting", "Posting"}:
-                jl = it.get("jobLocation")
-                if isinstance(jl, dict):
-                    jl = [jl]
-                if isinstance(jl, list):
-                    for loc in jl:
-                        addr = (loc or {}).get("address", {})
-                        parts = [addr.get("addressLocality"), addr.get("addressRegion"), addr.get("addressCountry")]
-                        parts = [p for p in parts if p]
-                        if parts:
-                            out.append(", ".join(parts))
+    for it in postings:
+        jl = it.get("jobLocation")
+        if isinstance(jl, dict):
+            jl = [jl]
+        if isinstance(jl, list):
+            for loc in jl:
+                addr = (loc or {}).get("address", {})
+                parts = [addr.get("addressLocality"), addr.get("addressRegion"), addr.get("addressCountry")]
+                parts = [p for p in parts if p]
+                if parts:
+                    out.append(", ".join(parts))
     return list(dict.fromkeys(out))
 
+def open_detail_cache(path: str = HTTP_CACHE_PATH) -> sqlite3.Connection:
+    """Open (creating if needed) the on-disk cache of parsed detail pages.
+
+    Rows are keyed by the SHA-1 of the URL and hold the response ETag, the
+    time it was stored and the parsed fields as JSON.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS details "
+        "(key TEXT PRIMARY KEY, etag TEXT, stored REAL, data TEXT)"
+    )
+    return conn
+
+def _cache_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+def cache_get(conn: sqlite3.Connection, url: str):
+    """Return (etag, stored_at, record) for `url`, or None when not cached."""
+    row = conn.execute(
+        "SELECT etag, stored, data FROM details WHERE key = ?", (_cache_key(url),)
+    ).fetchone()
+    if not row:
+        return None
+    return row[0], row[1], orjson.loads(row[2])
+
+def cache_put(conn: sqlite3.Connection, url: str, etag: str | None, rec: Dict[str, Any]) -> None:
+    """Store the parsed record for `url` along with its ETag."""
+    conn.execute(
+        "INSERT OR REPLACE INTO details (key, etag, stored, data) VALUES (?, ?, ?, ?)",
+        (_cache_key(url), etag, time.time(), orjson.dumps(rec).decode()),
+    )
+
+async def fetch_job_details_async(session: httpx.AsyncClient, sem: asyncio.Semaphore, url: str,
+                                  cache: sqlite3.Connection | None = None,
+                                  max_age: float = HTTP_CACHE_TTL) -> Dict[str, Any]:
+    """Fetch a job detail page over plain HTTP and extract server-side fields.
+
+    The semaphore bounds how many requests are in flight at once and
+    transient gateway errors are retried with backoff. Only the
+    fields available in the raw HTML (JSON-LD and inline text) are parsed
+    here, by `parse_detail_response`; client-rendered sections still
+    require the browser.
+
+    With a `cache`, results younger than `max_age` seconds are returned
+    without a request; older ones are revalidated with If-None-Match and
+    reused on a 304 response.
+
+    Args:
+        session: Shared HTTP/2 client for the scrape run.
+        sem: Semaphore limiting concurrent requests.
+        url: Full URL to the job detail page.
+        cache: Connection from `open_detail_cache`, if any.
+        max_age: Age in seconds under which a cached result is used as is.
+
+    Returns:
+        A dict with `date_posted`, `locations` and `pay_ranges`, or a full
+        detail record (with `title`) when built from JSON-LD.
+
+    Raises:
+        httpx.HTTPStatusError: The final response was neither a 200 nor a
+            304 for a cached page.
+    """
+    cached = cache_get(cache, url) if cache is not None else None
+    if cached and time.time() - cached[1] < max_age:
+        return cached[2]
+    headers = {"If-None-Match": cached[0]} if cached and cached[0] else {}
+
+    async with sem:
+        for attempt in range(HTTP_RETRIES + 1):
+            r = await session.get(url, headers=headers)
+            if r.status_code in RETRY_STATUSES and attempt < HTTP_RETRIES:
+                await asyncio.sleep(HTTP_BACKOFF * 2 ** attempt)
+                continue
+            etag = r.headers.get("ETag")
+            if r.status_code == 304 and cached:
+                cache_put(cache, url, etag or cached[0], cached[2])
+                return cached[2]
+            # Error pages are neither parsed nor cached; gather_details logs the failure
+            if r.status_code != 200:
+                raise httpx.HTTPStatusError(f"HTTP {r.status_code} for {url}", request=r.request, response=r)
+            break
+
+    rec = parse_detail_response(url, r)
+    if cache is not None:
+        cache_put(cache, url, etag, rec)
+    return rec
+
+def parse_detail_response(url: str, r: httpx.Response) -> Dict[str, Any]:
+    """Extract the server-side fields from a detail page response.
+
+    With PREFER_HTTP, a page whose JSON-LD holds the whole posting yields the
+    full detail record from `record_from_jsonld` instead.
+
+    The response's ETag and Last-Modified headers are kept on the result as
+    `last_etag` and `last_modified` for later `revalidate_detail` checks.
+    """
+    text = r.text
+    validators = {"last_etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+
+    # The JSON-LD is decoded once and shared by every extractor below
+    postings = list(jsonld_postings(text))
+    full = record_from_jsonld(url, text, postings) if PREFER_HTTP else None
+    if full:
+        full.update(validators)
+        return full
+
+    rec = {
+        "date_posted": display_date(parse_date_posted_from_detail(text, postings)),
+        "locations": extract_locations_jsonld(text, postings),
+        "pay_ranges": extract_pay_ranges(text),
+    }
+    rec.update(validators)
+    return rec
+
+async def revalidate_detail(session: httpx.AsyncClient, sem: asyncio.Semaphore, url: str,
+                            rec: Dict[str, Any], cache: sqlite3.Connection | None = None) -> Dict[str, Any] | None:
+    """Return None if the server reports `url` unchanged since `rec` was saved.
+
+    Sends the record's `last_etag` / `last_modified` as If-None-Match /
+    If-Modified-Since; only a 304 counts as unchanged, and records saved
+    without validators are always fetched. A changed page's 200 body is
+    parsed with `parse_detail_response` right away (and stored in `cache`)
+    so it isn't downloaded a second time.
+
+    Raises:
+        httpx.HTTPStatusError: The response was neither a 200 nor a 304.
+    """
+    headers = {}
+    if rec.get("last_etag"):
+        headers["If-None-Match"] = rec["last_etag"]
+    if rec.get("last_modified"):
+        headers["If-Modified-Since"] = rec["last_modified"]
+    async with sem:
+        r = await session.get(url, headers=headers)
+    if r.status_code == 304 and headers:
+        return None
+    if r.status_code != 200:
+        raise httpx.HTTPStatusError(f"HTTP {r.status_code} for {url}", request=r.request, response=r)
+    fresh = parse_detail_response(url, r)
+    if cache is not None:
+        cache_put(cache, url, r.headers.get("ETag"), fresh)
+    return fresh
+
+def http_client(max_concurrency: int = MAX_CONCURRENCY) -> httpx.AsyncClient:
+    """Return an HTTP/2 client whose pool holds `max_concurrency` connections."""
+    limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency,
+                          keepalive_expiry=30)
+    return httpx.AsyncClient(http2=True, limits=limits, timeout=HTTP_TIMEOUT, follow_redirects=True,
+                             headers={"User-Agent": USER_AGENT})
+
+async def gather_unchanged(saved: Dict[str, Dict[str, Any]],
+                           max_concurrency: int = MAX_CONCURRENCY) -> Tuple[set, Dict[str, Dict[str, Any]]]:
+    """Revalidate saved records concurrently.
+
+    `saved` maps URL -> stored record. Returns the set of unchanged URLs
+    and the records parsed from the changed pages' responses, keyed by
+    URL. Requests that fail count as changed, with no record, so the page
+    gets scraped again.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    cache = open_detail_cache()
+    try:
+        async with http_client(max_concurrency) as http:
+            results = await asyncio.gather(
+                *(revalidate_detail(http, sem, url, rec, cache) for url, rec in saved.items()),
+                return_exceptions=True,
+            )
+        cache.commit()
+    finally:
+        cache.close()
+    unchanged = {url for url, res in zip(saved, results) if res is None}
+    changed = {url: res for url, res in zip(saved, results) if isinstance(res, dict)}
+    return unchanged, changed
+
+async def gather_details(urls: List[str], max_concurrency: int = MAX_CONCURRENCY,
+                         fresh=()) -> Dict[str, Dict[str, Any]]:
+    """Fetch many job detail pages concurrently and return results keyed by URL.
+
+    One session and connection pool is shared by all requests so TCP/TLS
+    connections are reused, and parsed pages are memoized in the on-disk
+    detail cache. URLs in `fresh` are known to have changed, so an
+    unexpired cache entry isn't reused for them. Failed URLs are logged and
+    left out of the result.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    cache = open_detail_cache()
+    try:
+        async with http_client(max_concurrency) as http:
+            results = await asyncio.gather(
+                *(fetch_job_details_async(http, sem, url, cache, max_age=0 if url in fresh else HTTP_CACHE_TTL)
+                  for url in urls),
+                return_exceptions=True,
+            )
+        cache.commit()
+    finally:
+        cache.close()
+
+    out = {}
+    for url, res in zip(urls, results):
+        if isinstance(res, BaseException):
+            print(f"   ! prefetch failed for {url}: {res}")
+            continue
+        out[url] = res
+    return out
+
 def block_text_from_html(html: str) -> str:
     """Convert arbitrary HTML into readable block text preserving bullets.
 
     Traverses the HTML and converts list items into lines starting with a
     bullet character and paragraphs/divs into separate lines. Consecutive
-    duplicate lines are removed.
+    duplicate lines are removed. Parsing and traversal are done by lxml.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    pieces = []
-    for node in soup.descendants:
-        if isinstance(node, NavigableString):
-            continue
-        if node.name in ("ul", "ol"):
-            for li in node.select(":scope > li"):
-                t = norm(li.get_text(" ", strip=True))
-                if t:
-                    pieces.append("• " + t)
-        elif node.name in ("p", "div", "section"):
-            t = norm(node.get_text(" ", strip=True))
-            if t:
-                pieces.append(t)
-    
-    # Remove consecutive duplicates
+    try:
+        root = lxml_html.fragment_fromstring(html, create_parent="div")
+    except (etree.ParserError, ValueError):
+        return ""
     out = []
-    for p in pieces:
-        if not out or p != out[-1]:
-            out.append(p)
+    for node in root.iterdescendants("ul", "ol", "p", "div", "section"):
+        if node.tag in ("ul", "ol"):
+            texts = ("• " + t for t in (norm(" ".join(li.itertext())) for li in node.iterchildren("li")) if t)
+        else:
+            t = norm(" ".join(node.itertext()))
+            texts = (t,) if t else ()
+        # Consecutive duplicates are dropped as they are produced
+        for t in texts:
+            if not out or t != out[-1]:
+                out.append(t)
     return "\n".join(out)
 
 def find_span(text: str, pattern: re.Pattern, start_at: int = 0):
@@ -689,6 +958,45 @@ def split_qualifications(qual_text: str):
 
     return required_text, preferred_text, other_text
 
+def record_from_jsonld(url: str, html_text: str, postings=None) -> Dict[str, Any] | None:
+    """Build a full detail record from a page's JSON-LD, or None if it's incomplete.
+
+    The qualifications block is cut from the JobPosting description between
+    its "Qualifications" and "Responsibilities" headings. The record is only
+    returned when it has a title, a posted date and a Required
+    Qualifications section, so pages missing any of them go to the browser.
+    `postings` may hold the page's already decoded JobPosting objects.
+    """
+    if postings is None:
+        postings = list(jsonld_postings(html_text))
+    date_posted = parse_date_posted_from_detail(html_text, postings) if postings else None
+    for item in postings:
+        title = norm(item.get("title"))
+        description = block_text_from_html(item.get("description") or "")
+        start, end = find_span(description, QUAL_HEADING_RE)
+        if not (title and date_posted and start is not None):
+            continue
+        stop, _ = find_span(description, RESP_HEADING_RE, end)
+        qualifications_text = description[end:stop].strip()
+        if not REQ_RE.search(qualifications_text):
+            continue
+        req_text, pref_text, other_text = split_qualifications(qualifications_text)
+        m = JOB_URL_ID_RE.search(url)
+        return {
+            "job_id": m.group(1) if m else None,
+            "title": title,
+            "url": url,
+            "date_posted": display_date(date_posted),
+            "locations": extract_locations_jsonld(html_text, postings),
+            "travel": None,
+            "required_qualifications_text": req_text,
+            "other_requirements_text": other_text,
+            "preferred_qualifications_text": pref_text,
+            "qualifications_text": qualifications_text,
+            "pay_ranges": extract_pay_ranges(description),
+        }
+    return None
+
 def safe_text(el) -> str | None:
     """Safely extract normalized text from a Selenium element.
 
@@ -701,12 +1009,56 @@ def safe_text(el) -> str | None:
         # AttributeError if element doesn't have .text; StaleElementReference if DOM changed
         return None
 
+# Everything parse_detail_page reads from the rendered page, gathered in one
+# call with the same XPaths the element lookups used; called with LABELS.
+# Returns null when the title or its panel can't be found.
+_DETAIL_JS = """
+var labels = arguments[0];
+function X(xp, ctx) {
+    return document.evaluate(xp, ctx || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function text(n) { return n ? (n.innerText || n.textContent || '') : null; }
+var dp = X("//*[normalize-space()='Date posted']");
+var titleEl = dp && X("preceding::h1[1]", dp);
+var panel = titleEl && X("ancestor::*[.//*[normalize-space()='Date posted']][1]", titleEl);
+if (!panel) { return null; }
+var out = {title: text(titleEl), url: location.href, fields: {}, q_html: '',
+           location: text(X(".//h1/following::*[normalize-space()][1]", panel))};
+labels.forEach(function (label) {
+    var lab = X(".//*[normalize-space()='" + label + "' or normalize-space()='" + label + ":']", panel);
+    var val = null;
+    if (lab) {
+        ["./following-sibling::*[normalize-space()][1]", "following::*[normalize-space()][1]"].some(function (rel) {
+            var t = text(X(rel, lab));
+            if (t && t.trim()) { val = t; return true; }
+            return false;
+        });
+    }
+    out.fields[label] = val;
+});
+var qh = X(".//h2[normalize-space()='Qualifications'] | .//h3[normalize-space()='Qualifications']", panel);
+if (qh) {
+    var frag = [], sib = qh;
+    for (var i = 0; i < 160; i++) {
+        sib = sib.nextElementSibling;
+        if (!sib || /^h[23]$/i.test(sib.tagName)) { break; }
+        frag.push(sib.outerHTML);
+    }
+    out.q_html = frag.join('');
+}
+out.ld = Array.prototype.map.call(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    function (s) { return s.textContent; });
+return out;
+"""
+
 def parse_detail_page(url: str, driver: webdriver.Chrome) -> Dict[str, Any]:
     """Load a job detail page and extract structured fields.
 
     The function navigates to `url`, waits for the page to render, and
     extracts fields such as title, locations, travel, qualifications and
-    pay ranges using a combination of Selenium lookups and HTML parsing.
+    pay ranges. Once "Date posted" has rendered, everything is read from
+    the page with a single script call and parsed in Python.
 
     Args:
         url: Full URL to the job detail page.
@@ -717,85 +1069,46 @@ def parse_detail_page(url: str, driver: webdriver.Chrome) -> Dict[str, Any]:
         `date_posted`, `locations`, and qualification text blobs.
     """
     driver.get(url)
-    WebDriverWait(driver, 35).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
-    time.sleep(0.7)
-
-    # Find title by looking for "Date posted" anchor
-    dp = WebDriverWait(driver, 25).until(
-        EC.presence_of_element_located((By.XPATH, "//*[normalize-space()='Date posted']"))
+    # The title sits just before the "Date posted" label, so one wait covers both
+    WebDriverWait(driver, 35).until(
+        EC.presence_of_element_located((By.XPATH, "//h1/following::*[normalize-space()='Date posted']"))
     )
-    title_el = dp.find_element(By.XPATH, "preceding::h1[1]")
-    title = safe_text(title_el)
-
-    # Find the panel containing both title and "Date posted"
-    panel = title_el.find_element(By.XPATH, "ancestor::*[.//*[normalize-space()='Date posted']][1]")
+    page = driver.execute_script(_DETAIL_JS, LABELS)
+    if not page:
+        raise NoSuchElementException(f"job panel not found on {url}")
+    title = norm(page["title"])
+    current_url = page["url"]
 
     # Extract location
     location = None
-    try:
-        cand = panel.find_element(By.XPATH, ".//h1/following::*[normalize-space()][1]")
-        txt = safe_text(cand)
-        if txt and not any(x in txt for x in ("Apply", "Save", "Share job")):
-            location = txt
-    except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
-        # Missing element or DOM/driver issue - leave location as None
-        pass
+    txt = norm(page["location"])
+    if txt and not any(x in txt for x in ("Apply", "Save", "Share job")):
+        location = txt
 
     # Extract field values
-    def value_for(label: str) -> str | None:
-        try:
-            lab = panel.find_element(By.XPATH, f".//*[normalize-space()='{label}' or normalize-space()='{label}:']")
-        except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
-            return None
-        for rel in ["./following-sibling::*[normalize-space()][1]", "following::*[normalize-space()][1]"]:
-            try:
-                node = lab.find_element(By.XPATH, rel)
-                val = safe_text(node)
-                if val:
-                    return val
-            except (NoSuchElementException, StaleElementReferenceException, WebDriverException):
-                # Try next relation if current one fails
-                pass
-        return None
-
-    fields = {lab: value_for(lab) for lab in LABELS}
+    fields = {lab: norm(val) or None for lab, val in (page["fields"] or {}).items()}
 
-    # Extract qualifications HTML
-    q_html = ""
-    try:
-        qh = panel.find_element(By.XPATH, ".//h2[normalize-space()='Qualifications'] | .//h3[normalize-space()='Qualifications']")
-        frag, sib = [], qh
-        for _ in range(160):
-            try:
-                sib = sib.find_element(By.XPATH, "following-sibling::*[1]")
-            except NoSuchElementException:
-                break
-            tg = sib.tag_name.lower()
-            if tg in ("h2", "h3"):
-                break
-            frag.append(sib.get_attribute("outerHTML"))
-        q_html = "".join(frag)
-    except NoSuchElementException:
-        pass
+    # Qualifications HTML
+    q_html = page["q_html"] or ""
 
     qualifications_text = block_text_from_html(q_html) if q_html else ""
     req_text, pref_text, other_text = split_qualifications(qualifications_text)
     pay_ranges = extract_pay_ranges(qualifications_text)
 
-    # Fallback location extraction
+    # Fallback location extraction from the JSON-LD read by the same script
     if not location:
-        jl = extract_locations_jsonld(driver.page_source)
+        jl = locations_from_postings(postings_from_ldjson(page.get("ld") or []))
         if jl:
             location = " | ".join(jl)
 
     # Extract job ID
-    m = re.search(r"/job/(\d+)", driver.current_url)
+    m = JOB_URL_ID_RE.search(current_url)
     job_id = fields.get("Job number") or (m.group(1) if m else None)
 
     return {
         "job_id": job_id,
         "title": title,
-        "url": driver.current_url,
+        "url": current_url,
         "date_posted": fields.get("Date posted"),
         "locations": [location] if location else [],
         "travel": fields.get("Travel"),
@@ -806,88 +1119,231 @@ def parse_detail_page(url: str, driver: webdriver.Chrome) -> Dict[str, Any]:
         "pay_ranges": pay_ranges,
     }
 
-def scrape_job_details(job_ids, output_path: str):
-    """Fetch and store detailed job records for a list of job IDs.
-
-    Builds canonical job URLs for each job_id, skips already present
-    entries in `output_path`, and periodically restarts the browser to
-    reduce resource leaks. Saves progress atomically to the output file.
+def replay_checkpoint_log(log_path: str, output_path: str, db: Dict[str, Any]) -> int:
+    """Upsert the records of an NDJSON checkpoint log into `db`.
 
-    Args:
-        job_ids: Iterable of job IDs (or strings convertible to int).
-        output_path: Path where job details will be saved as JSON.
+    The log is what `scrape_job_details` appends between full saves; one is
+    only left behind by an interrupted run. It is replayed when it is at
+    least as new as `output_path`. Unreadable lines are skipped. Returns
+    the number of records applied.
     """
-    
-    # Build URLs
-    urls = []
-    seen = set()
-    for job_id in job_ids:
-        url = f"https://jobs.careers.microsoft.com/global/en/job/{int(job_id)}/"
-        if url and url not in seen:
-            seen.add(url)
-            urls.append(url)
-
-    details_db = load_db_atomic(output_path)
-    
-    drv = None
-    processed = 0
-    
     try:
-        print(f"[DETAILS] processing {len(urls)} job pages…")
-        for i, url in enumerate(urls, 1):
-            key = re.search(r"/job/(\d+)", url)
-            key = key.group(1) if key else url
-
-            if key in details_db:
-                print(f"[{i}/{len(urls)}] SKIP already saved: {key}")
+        log_mtime = os.path.getmtime(log_path)
+    except OSError:
+        return 0
+    if os.path.exists(output_path) and log_mtime < os.path.getmtime(output_path):
+        return 0
+    count = 0
+    with open(log_path, "rb") as f:
+        for line in f:
+            try:
+                rec = orjson.loads(line)
+            except orjson.JSONDecodeError:
                 continue
+            if isinstance(rec, dict):
+                upsert_record(rec, db)
+                count += 1
+    return count
+
+def _detail_worker(shard, total: int, out: "queue.Queue", driver=None) -> None:
+    """Scrape the `(i, url)` pairs in `shard` with a browser of this thread's own.
+
+    Each parsed record (or None after MAX_RETRIES failures) is put on `out`
+    as `(url, rec)`; a final None tells the consumer this worker is done.
+    A `driver` passed in is used first and left running; the browser is only
+    replaced when an error shows its session has died, and browsers the
+    worker launched are quit when the shard is finished.
+    """
+    drv = driver
+    own = False
+    try:
+        for i, url in shard:
+            if drv is None:
+                drv, own = launch_chrome(), True
 
-            # Restart browser periodically
-            if drv is None or (processed > 0 and processed % RESTART_EVERY == 0):
-                if drv:
-                    print(f"   - restarting browser after {RESTART_EVERY} jobs")
-                    drv.quit()
-                    time.sleep(2)
-                drv = launch_chrome()
-
-            print(f"[{i}/{len(urls)}] GET {url}")
-            success = False
+            print(f"[{i}/{total}] GET {url}")
+            rec = None
 
             for attempt in range(1, MAX_RETRIES + 1):
                 try:
                     rec = parse_detail_page(url, drv)
-                    upsert_record(rec, details_db)
-                    processed += 1
-                    success = True
                     break
-                except (WebDriverException, TimeoutException, NoSuchElementException, requests.RequestException) as e:
+                except (WebDriverException, TimeoutException, NoSuchElementException) as e:
                     print(f"   ! attempt {attempt} failed: {e}")
                     if "chrome" in str(e).lower() or "session" in str(e).lower():
+                        print("   - browser session lost, restarting it")
                         try:
-                            drv.quit()
+                            # A browser handed in by the caller is theirs to quit
+                            if own:
+                                drv.quit()
                         except (WebDriverException, AttributeError):
                             # If quitting the driver fails, ignore and recreate
                             pass
                         time.sleep(2)
-                        drv = launch_chrome()
+                        drv, own = launch_chrome(), True
                     time.sleep(1.0)
 
-            if not success:
-                print(f"   x failed all attempts: {url}")
+            out.put((url, rec))
+            sleep_a_bit()
+    finally:
+        out.put(None)
+        if drv and own:
+            drv.quit()
 
-            # Checkpoint save
-            if processed and processed % 5 == 0:
-                save_db_atomic(output_path, details_db)
-                print(f"   - checkpoint saved ({processed} records)")
+def scrape_job_details(job_ids, output_path: str, workers: int = DETAIL_WORKERS, driver=None,
+                       refresh: bool = REFRESH_DETAILS):
+    """Fetch and store detailed job records for a list of job IDs.
 
-            sleep_a_bit()
+    Builds canonical job URLs for each job_id, skips already present
+    entries in `output_path`, and restarts a browser only when its session
+    dies. Saves progress atomically to the output file.
+
+    With PREFER_HTTP, pages whose JSON-LD holds the whole posting are saved
+    straight from the HTTP prefetch. The remaining pages are split across
+    `workers` threads, each launching its own Chrome only once it has pages
+    to load. Records are merged and checkpointed on the calling thread.
+
+    With `refresh`, already saved pages are revalidated with a conditional
+    GET instead of being skipped: unchanged ones (304) only get their
+    `last_checked` timestamp bumped, changed ones are scraped again.
+
+    Args:
+        job_ids: Iterable of job IDs (or strings convertible to int).
+        output_path: Path where job details will be saved as JSON.
+        workers: Number of Chrome instances to run in parallel.
+        driver: Already running browser (e.g. from the listing phase) for
+            the first worker; it is left running for the caller to quit.
+        refresh: Revalidate saved pages instead of skipping them.
+
+    Returns:
+        The saved details database, for later steps to reuse.
+    """
+    
+    # Build URLs
+    urls = []
+    seen = set()
+    for job_id in job_ids:
+        url = f"https://jobs.careers.microsoft.com/global/en/job/{int(job_id)}/"
+        if url and url not in seen:
+            seen.add(url)
+            urls.append(url)
+
+    details_db = load_db_atomic(output_path)
+    log_path = output_path + ".ndjson"
+    replayed = replay_checkpoint_log(log_path, output_path, details_db)
+    if replayed:
+        save_db_atomic(output_path, details_db)
+        print(f"[DETAILS] recovered {replayed} records from {log_path}")
+
+    print(f"[DETAILS] processing {len(urls)} job pages…")
+    pending = []
+    saved = {}
+    for i, url in enumerate(urls, 1):
+        key = JOB_URL_ID_RE.search(url)
+        key = key.group(1) if key else url
+        if key in details_db:
+            if refresh:
+                saved[url] = (i, key)
+            else:
+                print(f"[{i}/{len(urls)}] SKIP already saved: {key}")
+            continue
+        pending.append((i, url))
+
+    refetched = {}
+    if saved:
+        # Changed pages come back already parsed from their 200 response
+        unchanged, refetched = asyncio.run(gather_unchanged({url: details_db[key] for url, (_, key) in saved.items()}))
+        checked_at = dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
+        for url, (i, key) in saved.items():
+            if url in unchanged:
+                details_db[key]["last_checked"] = checked_at
+                print(f"[{i}/{len(urls)}] SKIP unchanged (304): {key}")
+            else:
+                pending.append((i, url))
+        pending.sort()
+        print(f"   - {len(unchanged)}/{len(saved)} saved pages unchanged")
+
+    # Prefetch the server-rendered fields for all pending pages concurrently,
+    # on a worker thread; without PREFER_HTTP it overlaps with the browser
+    # workers, with it the browsers only start for pages JSON-LD can't fill
+    prefetch_pool = ThreadPoolExecutor(max_workers=1)
+    fetch_urls = [u for _, u in pending if u not in refetched]
+    prefetch = prefetch_pool.submit(
+        asyncio.run, gather_details(fetch_urls, fresh=set(saved))
+    ) if fetch_urls else None
+    prefetched = dict(refetched)
+    processed = 0
+    # Start a fresh log; anything in an old one is already in output_path
+    log = open(log_path, "wb")
+
+    def save(rec: Dict[str, Any]) -> None:
+        # Log every record as it arrives; rewrite the full file only now and then
+        nonlocal processed
+        upsert_record(rec, details_db)
+        log.write(orjson.dumps(rec) + b"\n")
+        log.flush()
+        processed += 1
+        if processed % CHECKPOINT_EVERY == 0:
+            save_db_atomic(output_path, details_db)
+            print(f"   - checkpoint saved ({processed} records)")
+
+    try:
+        if PREFER_HTTP and pending:
+            # Pages fully described by their JSON-LD don't need a browser at all
+            if prefetch is not None:
+                prefetched.update(prefetch.result())
+                prefetch = None
+            print(f"   - prefetched {len(prefetched)}/{len(pending)} pages over HTTP")
+            browser_pending = []
+            for i, url in pending:
+                rec = prefetched.get(url)
+                if rec and rec.get("title"):
+                    print(f"[{i}/{len(urls)}] HTTP {url}")
+                    save(dict(rec))
+                else:
+                    browser_pending.append((i, url))
+            if processed:
+                print(f"   - {processed} records built from JSON-LD")
+            pending = browser_pending
+
+        workers = max(1, min(workers, len(pending)))
+        out: queue.Queue = queue.Queue()
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(_detail_worker, pending[w::workers], len(urls), out,
+                                 driver if w == 0 else None)
+                       for w in range(workers)] if pending else []
+            running = len(futures)
+            while running:
+                item = out.get()
+                if item is None:
+                    running -= 1
+                    continue
+                url, rec = item
+                if rec is None:
+                    print(f"   x failed all attempts: {url}")
+                    continue
+                if prefetch is not None:
+                    prefetched.update(prefetch.result())
+                    prefetch = None
+                    print(f"   - prefetched {len(prefetched)}/{len(pending)} pages over HTTP")
+                # Fill fields the rendered page missed from the HTTP prefetch
+                for fld, val in prefetched.get(url, {}).items():
+                    if not rec.get(fld):
+                        rec[fld] = val
+                save(rec)
+            for f in futures:
+                f.result()
 
     finally:
+        prefetch_pool.shutdown(cancel_futures=True)
+        log.close()
         save_db_atomic(output_path, details_db)
-        if drv:
-            drv.quit()
+        # Everything logged is now in the JSON file
+        os.remove(log_path)
 
     print(f"[DONE] wrote {len(details_db)} records to {output_path}")
+    return details_db
 
 # ==================== JOB FILTERING ====================
 
@@ -899,16 +1355,15 @@ def to_text(val: Any) -> str:
     """
     if val is None:
         return ""
+    if isinstance(val, str):
+        return " ".join(val.split()).lower()
     if isinstance(val, list):
-        parts = []
-        for x in val:
-            if isinstance(x, dict):
-                parts.append(json.dumps(x, ensure_ascii=False))
-            else:
-                parts.append(str(x))
-        return norm(" | ".join(parts)).lower()
+        return norm(" | ".join(
+            orjson.dumps(x, option=orjson.OPT_NON_STR_KEYS).decode() if isinstance(x, dict) else str(x)
+            for x in val
+        )).lower()
     if isinstance(val, dict):
-        return norm(json.dumps(val, ensure_ascii=False)).lower()
+        return norm(orjson.dumps(val, option=orjson.OPT_NON_STR_KEYS).decode()).lower()
     return norm(str(val)).lower()
 
 def get_job_id(key: str, rec: Dict[str, Any]) -> str:
@@ -919,26 +1374,10 @@ def get_job_id(key: str, rec: Dict[str, Any]) -> str:
     """
     if rec.get("job_id"):
         return str(rec["job_id"])
-    m = re.search(r"/job/(\d+)", rec.get("url") or key or "")
+    m = JOB_URL_ID_RE.search(rec.get("url") or key or "")
     return m.group(1) if m else (rec.get("url") or key or "UNKNOWN")
 
-def iter_scannable_fields(rec: Dict[str, Any]):
-    """Yield the field names from `SCANNABLE_FIELDS` that exist in `rec`.
-
-    This helper restricts scanning to the configured set of fields.
-    """
-    for f in SCANNABLE_FIELDS:
-        if f in rec:
-            yield f
-
-def kw_boundary_search(blob: str, kw: str) -> bool:
-    """Return True if `kw` appears in `blob` using word-boundary matching.
-
-    Uses a regex that avoids matching substrings inside larger words.
-    """
-    return re.search(rf"(?<!\w){re.escape(kw)}(?!\w)", blob, re.I) is not None
-
-def materialize_field_keywords(per_field: Dict[str, List[str]], available_fields: List[str]) -> Dict[str, List[str]]:
+def materialize_field_keywords(per_field: Dict[str, List[str]], available_fields: Iterable[str]) -> Dict[str, List[str]]:
     """Expand wildcard '*' keywords into specific available fields.
 
     Returns a mapping of field -> sorted keyword list for only the fields
@@ -954,13 +1393,118 @@ def materialize_field_keywords(per_field: Dict[str, List[str]], available_fields
             result[field] = sorted(kws)
     return result
 
-def filter_jobs(details_path: str, output_path: str):
+# Per-class keywords with '*' expanded over every scannable field, computed once.
+MATERIALIZED_RULES: Dict[str, Dict[str, List[str]]] = {
+    cls: materialize_field_keywords(per_field, SCANNABLE_FIELDS) for cls, per_field in AVOID_RULES.items()
+}
+
+_KEYWORD_AUTOMATON = None
+_COMPILED_RULES = None
+TRIE_MIN_KEYWORDS = 5
+
+def _is_word_char(ch: str) -> bool:
+    """Return True for characters regex `\\w` would match."""
+    return ch.isalnum() or ch == "_"
+
+def keyword_automaton():
+    """Return one Aho-Corasick automaton over every `AVOID_RULES` keyword, built once.
+
+    Keys are the lowercased keywords; each value is `(keyword, owners)`
+    where owners lists the `(class, field or "*", original keyword)` rules
+    the keyword comes from, so a single automaton serves every field and
+    class.
+    """
+    global _KEYWORD_AUTOMATON
+    if _KEYWORD_AUTOMATON is None:
+        owners: Dict[str, list] = {}
+        for cls, per_field in AVOID_RULES.items():
+            for field, kws in per_field.items():
+                for kw in kws:
+                    owners.setdefault(kw.lower(), []).append((cls, field, kw))
+        a = ahocorasick.Automaton()
+        for word, rules in owners.items():
+            a.add_word(word, (word, rules))
+        a.make_automaton()
+        _KEYWORD_AUTOMATON = a
+    return _KEYWORD_AUTOMATON
+
+def automaton_hits(automaton, blob: str, field: str) -> Dict[str, set]:
+    """Scan lowercase `blob` of `field` once; return {class: {keywords}} with word boundaries."""
+    found: Dict[str, set] = {}
+    n = len(blob)
+    for end, (word, rules) in automaton.iter(blob):
+        start = end - len(word) + 1
+        if start > 0 and _is_word_char(blob[start - 1]):
+            continue
+        if end + 1 < n and _is_word_char(blob[end + 1]):
+            continue
+        for cls, rule_field, kw in rules:
+            if rule_field == "*" or rule_field == field:
+                found.setdefault(cls, set()).add(kw)
+    return found
+
+def keyword_alternation(kws: Iterable[str]) -> str:
+    """Return an unanchored regex alternation matching any of the lowercased `kws`.
+
+    Lists longer than `TRIE_MIN_KEYWORDS` are folded into a shared-prefix
+    trie (``re(?:cruit(?:er|ment)|search)``) when trieregex is installed;
+    shorter lists use a flat longest-first alternation.
+    """
+    lowered = sorted({k.lower() for k in kws}, key=len, reverse=True)
+    if TrieRegEx is not None and len(lowered) > TRIE_MIN_KEYWORDS:
+        return TrieRegEx(*lowered).regex()
+    return "|".join(re.escape(k) for k in lowered)
+
+def _overlaps(a: str, b: str) -> bool:
+    """Return True if occurrences of `a` and `b` can share characters in a text."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
+
+def compiled_rules() -> Dict[str, Dict[str, Any]]:
+    """Return {class: {field: (pattern, by_match, confirm)}}, built once.
+
+    Each pattern is one word-bounded alternation of the class's keywords
+    for that field (see `keyword_alternation`), so a single `finditer`
+    pass finds the keywords in a blob; `by_match` maps matched text to
+    the original keywords. finditer can't report two matches that overlap,
+    so keywords that could overlap another one are listed in `confirm` as
+    (keyword, keyword_pattern) pairs and checked on their own when missed.
+    Field blobs from `to_text` are already lowercase, so every pattern is
+    compiled from lowercased keywords without re.IGNORECASE.
+    """
+    global _COMPILED_RULES
+    if _COMPILED_RULES is None:
+        rules = {}
+        for cls, per_field in MATERIALIZED_RULES.items():
+            for field, kws in per_field.items():
+                alt = keyword_alternation(kws)
+                by_match: Dict[str, List[str]] = {}
+                for kw in kws:
+                    by_match.setdefault(kw.lower(), []).append(kw)
+                confirm = [
+                    (kw, re.compile(rf"(?<!\w){re.escape(kw.lower())}(?!\w)"))
+                    for kw in kws
+                    if any(_overlaps(kw.lower(), other) for other in by_match if other != kw.lower())
+                ]
+                rules.setdefault(cls, {})[field] = (re.compile(rf"(?<!\w)(?:{alt})(?!\w)"), by_match, confirm)
+        _COMPILED_RULES = rules
+    return _COMPILED_RULES
+
+def filter_jobs(details_path: str, output_path: str, details_db: Dict[str, Any] | None = None):
     """Scan job detail records and produce buckets of hits based on rules.
 
-    Loads the details database from `details_path`, checks each record using
-    `AVOID_RULES`, and writes a JSON summary of hits to `output_path`.
+    Loads the details database from `details_path` (unless the already
+    loaded `details_db` is passed), checks each record using `AVOID_RULES`,
+    and writes a JSON summary of hits to `output_path`.
+
+    With pyahocorasick installed each field is scanned once for the
+    keywords of all classes; otherwise each class/field pair is scanned
+    once with its precompiled alternation (see `compiled_rules`).
     """
-    details = load_db(details_path)
+    details = load_db_atomic(details_path) if details_db is None else details_db
+    automaton = keyword_automaton() if ahocorasick is not None else None
+    rules = compiled_rules() if automaton is None else None
     hits_out = {}
     total = 0
     total_hits = 0
@@ -970,31 +1514,45 @@ def filter_jobs(details_path: str, output_path: str):
         job_id = get_job_id(key, rec)
 
         # Cache field text
-        available_fields = list(iter_scannable_fields(rec))
-        field_blob = {f: to_text(rec.get(f)) for f in available_fields}
-
-        for cls, per_field in AVOID_RULES.items():
-            field_kws = materialize_field_keywords(per_field, available_fields)
-            if not field_kws:
-                continue
+        field_blob = {f: to_text(rec[f]) for f in SCANNABLE_FIELDS if f in rec}
+
+        if automaton is not None:
+            per_class: Dict[str, Dict[str, List[str]]] = {}
+            for field, blob in field_blob.items():
+                if blob:
+                    for cls, kws in automaton_hits(automaton, blob, field).items():
+                        per_class.setdefault(cls, {})[field] = sorted(kws)
+            for cls in AVOID_RULES:
+                matched_fields = per_class.get(cls)
+                if matched_fields:
+                    bucket = hits_out.setdefault(cls, {"job_ids": set(), "matches": {}})
+                    if job_id not in bucket["job_ids"]:
+                        bucket["job_ids"].add(job_id)
+                        total_hits += 1
+                    bucket["matches"][job_id] = matched_fields
+            continue
 
+        for cls, field_rules in rules.items():
             matched_fields = {}
-            for field, kws in field_kws.items():
-                blob = field_blob.get(field, "")
-                if not blob:
+            for field, blob in field_blob.items():
+                if not blob or field not in field_rules:
+                    continue
+                pat, by_match, confirm = field_rules[field]
+                hits = {m.group(0) for m in pat.finditer(blob)}
+                if not hits:
                     continue
-                found = [kw for kw in kws if kw_boundary_search(blob, kw)]
-                if found:
-                    matched_fields[field] = sorted(set(found))
+                found = {kw for text in hits for kw in by_match[text]}
+                found.update(kw for kw, kw_pat in confirm if kw not in found and kw_pat.search(blob))
+                matched_fields[field] = sorted(found)
 
             if matched_fields:
-                bucket = hits_out.setdefault(cls, {"job_ids": [], "matches": {}})
+                bucket = hits_out.setdefault(cls, {"job_ids": set(), "matches": {}})
                 if job_id not in bucket["job_ids"]:
-                    bucket["job_ids"].append(job_id)
+                    bucket["job_ids"].add(job_id)
                     total_hits += 1
                 bucket["matches"][job_id] = matched_fields
 
-    # Sort and clean up
+    # Sort the id sets into lists for saving and drop empty classes
     for cls, bucket in list(hits_out.items()):
         bucket["job_ids"] = sorted(bucket["job_ids"], key=lambda x: (len(str(x)), str(x)))
         if not bucket["job_ids"]:
@@ -1011,18 +1569,20 @@ def filter_jobs(details_path: str, output_path: str):
 
 # ==================== JOB ORGANIZATION ====================
 
-def cleanup_old_jobs(details_path: str, days: int = 10) -> list[str]:
+def cleanup_old_jobs(details_path: str, days: int = 10, details_db: Dict[str, Any] | None = None) -> list[str]:
     """Remove job detail records older than `days` from the database.
 
     Parses the `date_posted` field of each record and removes entries older
     than the cutoff. Returns the list of removed job ids for further
-    cleanup in the main jobs DB.
+    cleanup in the main jobs DB. A `details_db` that is passed in is
+    updated in place instead of being loaded from `details_path`.
     """
     
     cutoff_date = dt.date.today() - dt.timedelta(days=days)
     print(f"Removing jobs older than: {cutoff_date}")
     
-    details_db = load_db_atomic(details_path)
+    if details_db is None:
+        details_db = load_db_atomic(details_path)
     original_count = len(details_db)
     removed_count = 0
     
@@ -1034,7 +1594,7 @@ def cleanup_old_jobs(details_path: str, days: int = 10) -> list[str]:
         if date_posted and date_posted != 'unknown':
             try:
                 parsed_date = parse_date(date_posted)
-                if parsed_date != dt.datetime.max:
+                if parsed_date is not _PARSE_FAIL:
                     job_date = parsed_date.date()
                     if job_date < cutoff_date:
                         jobs_to_remove.append(job_id)
@@ -1069,7 +1629,7 @@ def cleanup_main_jobs_db(main_db_path: str, old_job_ids: list = None):
         Number of removed entries.
     """
 
-    main_db_ids = set(load_db(main_db_path))
+    main_db_ids = set(load_ids(main_db_path))
     original_count = len(main_db_ids)
     removed_count = 0
     
@@ -1082,9 +1642,11 @@ def cleanup_main_jobs_db(main_db_path: str, old_job_ids: list = None):
                 main_db_ids.remove(job_id)
                 removed_count += 1
         
-        # Save updated database
+        # Save updated database; it now includes everything in the log
         if removed_count > 0:
             save_db_atomic(main_db_path, main_db_ids)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(main_db_path + WAL_SUFFIX)
             print(f"Removed {removed_count} old jobs from {main_db_path}")
             print(f"Jobs remaining: {len(main_db_ids)} (was {original_count})")
         else:
@@ -1156,20 +1718,49 @@ def cleanup_old_job_files(save_path: str) -> int:
     
     return files_removed
 
-def organize_jobs_by_date(save_path: str, details_path: str, filtered_path: str = None):
+def date_token(d) -> str:
+    """Return the jobs_by_date filename token for `d`, e.g. "01_october_2026"."""
+    return f"{d.day:02d}_{_MONTHS[d.month - 1]}_{d.year}"
+
+def _serialize_bucket(item):
+    """Return (date_str, job_count, bytes, digest) for one jobs_by_date bucket."""
+    date_str, jobs_list = item
+    data = orjson.dumps(jobs_list, option=orjson.OPT_INDENT_2)
+    return date_str, len(jobs_list), data, hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def serialize_buckets(items: list):
+    """Yield `_serialize_bucket` results for `items` in order.
+
+    From SERIALIZE_PROCESSES_MIN buckets up the encoding is spread over a
+    process pool; fewer are encoded inline, where starting the pool would
+    cost more than it saves.
+    """
+    if len(items) < SERIALIZE_PROCESSES_MIN:
+        yield from map(_serialize_bucket, items)
+        return
+    with ProcessPoolExecutor() as ex:
+        yield from ex.map(_serialize_bucket, items, chunksize=8)
+
+def organize_jobs_by_date(save_path: str, details_path: str, filtered_path: str = None,
+                          details_db: Dict[str, Any] | None = None):
     """Group filtered jobs by their posted date and write per-date JSON files.
 
     Uses `filtered_path` to restrict the set of jobs when provided and writes
     files into `{save_path}/jobs_by_date` with a filename-safe date token.
+    An already loaded `details_db` is used instead of reading `details_path`.
+    A BLAKE2b digest of every file written is kept in the directory's
+    `.digests` manifest, and files whose content hasn't changed are not
+    rewritten.
     """
     # Load data
-    details_db = load_db_atomic(details_path)
+    if details_db is None:
+        details_db = load_db_atomic(details_path)
 
     if filtered_path is None or not os.path.exists(filtered_path):
         print("[ORGANIZE] no filtered path provided or file does not exist, skipping filtering step.")
         wanted_jobs = set(details_db.keys())
     else:
-        filtered_db = load_db(filtered_path)
+        filtered_db = load_db_atomic(filtered_path)
 
         # Calculate wanted Python jobs
         python_jobs = set(filtered_db.get('knowledge_python', {}).get('job_ids', []))
@@ -1179,71 +1770,100 @@ def organize_jobs_by_date(save_path: str, details_path: str, filtered_path: str
         unwanted_positions = set(filtered_db.get('unwanted_positions', {}).get('job_ids', []))
         senior_only = set(filtered_db.get('senior_only', {}).get('job_ids', []))
         
-        wanted_jobs = python_jobs - knowledge_fullstack - clearance_required - visa_sponsorship_block - unwanted_positions - senior_only
+        # Only ids with a details record; a filtered id without one has nothing to write
+        excluded = knowledge_fullstack | clearance_required | visa_sponsorship_block | unwanted_positions | senior_only
+        wanted_jobs = (python_jobs & details_db.keys()) - excluded
         
         print(f"Total Python jobs: {len(python_jobs)}")
         print(f"Total knowledge fullstack jobs: {len(knowledge_fullstack)}")
         print(f"Total wanted Python jobs: {len(wanted_jobs)}")
 
-    # Group jobs by date
-    jobs_by_date = defaultdict(list)
+    # Pair every job with its date token, then group runs of equal tokens
+    dated = []
 
-    for job_id in wanted_jobs:
-        job = details_db.get(job_id, {})
+    # Sorted so unchanged buckets serialize to identical bytes run after run
+    for job_id in sorted(wanted_jobs, key=lambda x: (len(x), x)):
+        job = details_db[job_id]
         date_posted = job.get('date_posted', 'unknown')
         
         # Create filename-friendly date
         if date_posted and date_posted != 'unknown':
             try:
                 parsed_date = parse_date(date_posted)
-                if parsed_date != dt.datetime.max:
-                    filename_date = parsed_date.strftime("%d_%B_%Y").lower()
+                if parsed_date is not _PARSE_FAIL:
+                    filename_date = date_token(parsed_date)
                 else:
-                    filename_date = date_posted.replace("-", "_").replace(" ", "_").replace(",", "")
+                    filename_date = date_posted.translate(_DATE_TRANS)
             except (ValueError, TypeError):
-                filename_date = date_posted.replace("-", "_").replace(" ", "_").replace(",", "")
+                filename_date = date_posted.translate(_DATE_TRANS)
         else:
             filename_date = "unknown_date"
         
-        jobs_by_date[filename_date].append({
-            "job_id": job_id,
-            "title": job.get('title'),
-            "locations": job.get('locations'),
-            "travel": job.get('travel'),
-            "date_posted": date_posted,
-            "url": job.get('url'),
-            "required_qualifications_text": job.get('required_qualifications_text'),
-            "preferred_qualifications_text": job.get('preferred_qualifications_text'),
-            "other_requirements_text": job.get('other_requirements_text'),
-            "pay_ranges": job.get('pay_ranges')
-        })
+        try:
+            vals = _JOB_FILE_GET(job)
+        except KeyError:
+            vals = tuple(job.get(k) for k in _JOB_FILE_FIELDS)
+        dated.append(
+            (filename_date, {"job_id": job_id, **dict(zip(_JOB_FILE_FIELDS, vals)), "date_posted": date_posted})
+        )
+    # Stable sort, so each bucket keeps the job id order
+    by_date = operator.itemgetter(0)
+    dated.sort(key=by_date)
+    jobs_by_date = [
+        (date_str, [entry for _, entry in group]) for date_str, group in itertools.groupby(dated, key=by_date)
+    ]
     
     # Save files
     output_dir = f"{save_path}"
     output_dir = os.path.join(output_dir, "jobs_by_date")
     os.makedirs(output_dir, exist_ok=True)
     
-    date_today = dt.date.today().strftime("%d_%B_%Y").lower()
-    date_yesterday = (dt.date.today() - dt.timedelta(days=1)).strftime("%d_%B_%Y").lower()
+    manifest_path = os.path.join(output_dir, ".digests")
+    digests = load_db_atomic(manifest_path)
+
+    date_today = date_token(dt.date.today())
+    date_yesterday = date_token(dt.date.today() - dt.timedelta(days=1))
+    recent = {date_today, date_yesterday}
     files_created = 0
     jobs_saved = 0
-    for date_str, jobs_list in jobs_by_date.items():
+    # One directory listing instead of a path join and stat per bucket
+    prefix = os.path.join(output_dir, "")
+    existing = set(os.listdir(output_dir))
+    # Existing files are only rewritten for today and yesterday
+    pending = [
+        (date_str, jobs_list) for date_str, jobs_list in jobs_by_date
+        if date_str in recent or f"jobs_{date_str}.json" not in existing
+    ]
+    writes = []
+    for date_str, count, data, digest in serialize_buckets(pending):
         filename = f"jobs_{date_str}.json"
-        filepath = os.path.join(output_dir, filename)
-        if os.path.exists(filepath) and date_str not in [date_today, date_yesterday]:  # If file path exists, append a suffix to avoid overwriting
+        filepath = prefix + filename
+        if digests.get(filename) == digest and filename in existing:
+            print(f"Unchanged file for date {date_str}: {filepath}")
             continue
+        if date_str in recent:
+            print(f"Overwriting file for date {date_str}: {filepath}")
         else:
-            if date_str in [date_today, date_yesterday]:
-                print(f"Overwriting file for date {date_str}: {filepath}")
-            else:
-                print(f"Creating new file for date {date_str}: {filepath}")
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(jobs_list, f, ensure_ascii=False, indent=2)
-            
-            print(f"Saved {len(jobs_list)} jobs to {filepath}")
-            files_created += 1
-            jobs_saved += len(jobs_list)
+            print(f"Creating new file for date {date_str}: {filepath}")
+
+        writes.append((filepath, data))
+        digests[filename] = digest
+        existing.add(filename)
+
+        print(f"Saved {count} jobs to {filepath}")
+        files_created += 1
+        jobs_saved += count
+
+    # The GIL is released during write/fsync, so the files are written concurrently
+    if writes:
+        with ThreadPoolExecutor(max_workers=min(8, len(writes))) as ex:
+            list(ex.map(lambda w: write_bytes(*w), writes))
+
+    # Forget digests of files that have since been cleaned up; on a run
+    # where nothing changed the manifest isn't rewritten either
+    kept = {name: d for name, d in digests.items() if name in existing}
+    if writes or len(kept) != len(digests):
+        save_db_atomic(manifest_path, kept)
 
     print(f"Total files created/overwritten: {files_created}")
     print(f"Total jobs saved: {jobs_saved}")
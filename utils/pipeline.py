@@ -0,0 +1,105 @@
+"""
+pipeline.py
+
+The Microsoft daily scrape as one parameterized pipeline: listing pages,
+detail pages, keyword filtering, per-date files and cleanup.
+
+Entry-point scripts only supply paths and settings, so changes to the
+steps are made here once instead of in every script.
+"""
+
+import datetime as dt
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.ms_core import (
+    launch_chrome,
+    scrape_paginated,
+    scrape_job_details,
+    filter_jobs,
+    organize_jobs_by_date,
+    cleanup_old_jobs,
+    cleanup_main_jobs_db,
+    cleanup_old_job_files,
+    load_ids,
+    append_wal,
+    compact_db,
+)
+
+
+def run_pipeline(*, db_path: str, details_path: str, filtered_path: str, folder: str,
+                 filters, max_pages: int, days_to_keep: int | None = None, seen_global_ids=None):
+    """Run the scrape → details → filter → organize → cleanup steps.
+
+    Args:
+        db_path: JSON list of known job ids (plus its append-only log).
+        details_path: JSON dict of job detail records.
+        filtered_path: Where the keyword filter hits are written.
+        folder: Company output folder holding `jobs_by_date`.
+        filters: Filter settings from config; None skips the filter step.
+        max_pages: Maximum listing pages to walk.
+        days_to_keep: Age in days after which jobs are cleaned up; None
+            skips the cleanup step.
+        seen_global_ids: Known job ids; loaded from `db_path` when None.
+    """
+    print("Paths:", db_path, details_path, filtered_path)
+    print(f"Starting scrape at {dt.datetime.now().isoformat()}")
+
+    # Step 1: Scrape job listings
+    print("\n[STEP 1] Scraping job listings...")
+    previous_job_ids = load_ids(db_path) if seen_global_ids is None else seen_global_ids
+    print(f"[DB] existing records: {len(previous_job_ids)}")
+
+    # One browser serves the listing pages and then the first detail worker
+    driver = launch_chrome()
+    try:
+        new_job_ids, all_job_ids = scrape_paginated(max_pages=max_pages, seen_global_ids=previous_job_ids,
+                                                    driver=driver)
+        print(f"[SCRAPE] total new rows scraped: {len(new_job_ids)}")
+        print(f"[SCRAPE] total unique job ids: {len(all_job_ids)}")
+
+        # Only the new ids are written; the full list is rewritten when the log grows
+        append_wal(db_path, new_job_ids)
+        if compact_db(db_path):
+            print(f"[DB] compacted log into: {db_path}")
+        print(f"[DB] saved to: {db_path}")
+
+        # Step 2: Scrape job details
+        print("\n[STEP 2] Scraping job details...")
+        details_db = scrape_job_details(new_job_ids, details_path, driver=driver)
+    finally:
+        try:
+            driver.quit()
+        except WebDriverException:
+            # The session may already have died during the detail phase
+            pass
+
+    # Steps 3-5 share the details DB loaded (and saved) by step 2
+    # Step 3: Filter jobs
+    if filters is None:
+        print("\n[STEP 3] No filters defined, skipping filtering step.")
+        filtered_path = None
+    else:
+        print("\n[STEP 3] Filtering jobs...")
+        filter_jobs(details_path, filtered_path, details_db=details_db)
+
+    # Step 4: Organize by date
+    print("\n[STEP 4] Organizing jobs by date...")
+    organize_jobs_by_date(folder, details_path, filtered_path, details_db=details_db)
+
+    # Step 5: Cleanup old jobs from details DB and main jobs DB
+    if days_to_keep is None:
+        print("\n[STEP 5] No retention configured, skipping cleanup step.")
+    else:
+        print(f"\n[STEP 5] Cleaning up old jobs from details and main DB up to {days_to_keep} days old...")
+
+        old_job_ids = cleanup_old_jobs(details_path, days=days_to_keep, details_db=details_db)
+        print(f"Total old jobs removed from details DB: {len(old_job_ids)}")
+
+        removed_count = cleanup_main_jobs_db(db_path, old_job_ids)
+        print(f"Total old jobs removed from main DB: {removed_count}")
+
+        files_removed = cleanup_old_job_files(folder)
+        print(f"Total files removed in jobs by date: {files_removed}")
+
+    print(f"\n=== Scraping completed at {dt.datetime.now().isoformat()} ===")